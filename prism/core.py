@@ -6,8 +6,9 @@ Uses StorageManager for .prism/ folder-based storage exclusively.
 """
 
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from prism.exceptions import ValidationError
 from prism.managers import (
@@ -21,11 +22,13 @@ from prism.managers import (
 from prism.managers.crud_manager import CRUDManager
 from prism.models.base import (
     Action,
+    BaseItem,
     Deliverable,
     Milestone,
     Objective,
     Phase,
 )
+from prism.models.project import Project
 
 
 class PrismCore:
@@ -52,24 +55,35 @@ class PrismCore:
         self.storage = StorageManager(prism_dir)
         self.archive_manager = ArchiveManager(self.storage)
         self.project_manager = ProjectManager(self.storage, self.archive_manager)
+        self.orphan_manager = OrphanManager(self.storage)
 
-        # Load project from storage
-        self.project = self.project_manager.load()
+    # The project and the managers bound to it are built on first use, so
+    # commands that never touch the tree (orphans, bugs) skip the load.
 
-        # Initialize managers
-        self.navigator = NavigationManager(self.project)
-        self.task_manager = TaskManager(
-            self.project,
-            self.navigator,
-            self._save_project,
-        )
-        self.crud_manager = CRUDManager(
+    @cached_property
+    def project(self) -> Project:
+        """Project loaded from storage on first access."""
+        return self.project_manager.load()
+
+    @cached_property
+    def navigator(self) -> NavigationManager:
+        """NavigationManager for the loaded project."""
+        return NavigationManager(self.project)
+
+    @cached_property
+    def task_manager(self) -> TaskManager:
+        """TaskManager for the loaded project."""
+        return TaskManager(self.project, self.navigator, self._save_project)
+
+    @cached_property
+    def crud_manager(self) -> CRUDManager:
+        """CRUDManager for the loaded project."""
+        return CRUDManager(
             self.project,
             self.navigator,
             self.archive_manager,
             self.task_manager,
         )
-        self.orphan_manager = OrphanManager(self.storage)
 
     def _save_project(self) -> None:
         """Save project to storage."""
@@ -84,10 +98,10 @@ class PrismCore:
         item_type: str,
         name: str,
         description: Optional[str],
-        parent_path: Optional[str],
+        parent_path: Optional[Union[str, BaseItem]],
         status: Optional[str] = None,
     ) -> Any:
-        """Add a new item to the project."""
+        """Add a new item under a parent given by path or as the item itself."""
         result = self.crud_manager.add_item(
             item_type, name, description, parent_path, status
         )
@@ -277,6 +291,8 @@ class PrismCore:
             "overdue_actions": [],
             "orphaned_items": [],
         }
+        # One reference time for the whole summary, not one clock read per action
+        now = datetime.now()
 
         def _traverse(items, parent_path="", parent_is_completed=False):
             for item in items:
@@ -301,7 +317,7 @@ class PrismCore:
                     isinstance(item, Action)
                     and not is_completed
                     and item.due_date
-                    and item.due_date < datetime.now()
+                    and item.due_date < now
                 ):
                     summary["overdue_actions"].append(
                         {"path": current_path, "due_date": item.due_date.isoformat()}
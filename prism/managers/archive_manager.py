@@ -7,7 +7,7 @@ Handles all archive operations including:
 - Loading archived data on-demand via signals
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from prism.managers.storage_manager import StorageManager
 from prism.models.archived import ArchivedItem, LoadState
@@ -86,30 +86,48 @@ class ArchiveManager:
             item: The completed BaseItem to archive.
             item_type: Type string ('phase', 'milestone', 'objective').
         """
+        self.archive_strategic_items([item])
+
+    def archive_strategic_items(self, items: List[BaseItem]) -> None:
+        """
+        Archive several completed strategic items in one pass.
+
+        archive/strategic.json is loaded and saved once for the whole batch,
+        and every file (including each objective's execution tree) lands
+        together in a single storage transaction.
+
+        Args:
+            items: The completed BaseItems to archive.
+        """
+        if not items:
+            return
+
         # Invalidate cache
         self._cached_strategic = None
 
-        # Load existing archived items
-        archived = self.storage.load_archived_strategic()
-
-        def append_item(am, item):
-            if not isinstance(item, ArchivedItem):
-                item.status = "archived"
-            if isinstance(item, Phase):
-                archived.phases.append(item)
-                for milestone in item.children:
-                    append_item(am, milestone)
-            elif isinstance(item, Milestone):
-                archived.milestones.append(item)
-                for objective in item.children:
-                    append_item(am, objective)
-            elif isinstance(item, Objective):
-                archived.objectives.append(item)
-                am._archive_execution_tree(item)
-
-        append_item(self, item)
-        # Save
-        self.storage.save_archived_strategic(archived)
+        with self.storage.transaction():
+            # Load existing archived items
+            archived = self.storage.load_archived_strategic()
+
+            # Depth-first with an explicit stack; children are pushed in
+            # reverse so each archive list keeps pre-order
+            stack = list(reversed(items))
+            while stack:
+                item = stack.pop()
+                if not isinstance(item, ArchivedItem):
+                    item.status = "archived"
+                if isinstance(item, Phase):
+                    archived.phases.append(item)
+                elif isinstance(item, Milestone):
+                    archived.milestones.append(item)
+                else:
+                    if isinstance(item, Objective):
+                        archived.objectives.append(item)
+                        self._archive_execution_tree(item)
+                    continue
+                stack.extend(reversed(item.children))
+            # Save
+            self.storage.save_archived_strategic(archived)
 
     def _archive_execution_tree(self, objective: Objective) -> None:
         """
@@ -6,7 +6,7 @@ Handles all CRUD operations for strategic and execution items.
 
 import re
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import click
 
@@ -34,6 +34,10 @@ from prism.models.base import (
 from prism.models.project import Project
 from prism.utils import parse_date, validate_date_range
 
+# Runs of non-slug characters, hyphens included, so each run collapses to
+# a single hyphen in one pass
+_NON_SLUG_CHARS = re.compile(r"[^a-z0-9]+")
+
 
 class CRUDManager:
     """
@@ -74,7 +78,7 @@ class CRUDManager:
         item_type: str,
         name: str,
         description: Optional[str],
-        parent_path: Optional[str],
+        parent_path: Optional[Union[str, BaseItem]],
         status: Optional[str] = None,
     ) -> BaseItem:
         """Add a new item to the project.
@@ -83,7 +87,8 @@ class CRUDManager:
             item_type: Type of item to add.
             name: Item name.
             description: Item description.
-            parent_path: Path to parent item, or None for phases.
+            parent_path: Path to parent item, the parent item itself, or None
+                for phases.
             status: Optional item status.
 
         Returns:
@@ -94,8 +99,10 @@ class CRUDManager:
             NotFoundError: If parent item not found.
             InvalidOperationError: If parent-child relationship is invalid.
         """
+        parent_item = self._resolve_parent(parent_path)
+
         # Get sibling items for slug generation
-        items_to_check = self._get_sibling_items(parent_path, item_type)
+        items_to_check = self._get_sibling_items(parent_item, item_type)
 
         # Generate unique slug
         slug = self._generate_unique_slug(items_to_check, name)
@@ -104,14 +111,7 @@ class CRUDManager:
         new_item = self._create_item(item_type, name, description, slug, status)
 
         # Add to parent or project
-        if parent_path:
-            parent_item = self.navigator.get_item_by_path(parent_path)
-            if not parent_item:
-                raise NotFoundError(
-                    f"Parent item not found at path: '{parent_path}'. "
-                    f"Please verify the path is correct and the parent item exists."
-                )
-
+        if parent_item:
             # Set parent_uuid on the new item
             new_item.parent_uuid = parent_item.uuid
 
@@ -132,6 +132,34 @@ class CRUDManager:
 
         return new_item
 
+    def _resolve_parent(
+        self, parent: Optional[Union[str, BaseItem]]
+    ) -> Optional[BaseItem]:
+        """Resolve a parent given as a path or as the item itself.
+
+        Args:
+            parent: Path to the parent, the parent item, or None.
+
+        Returns:
+            The parent item, or None when no parent (or an empty path) was
+            given.
+
+        Raises:
+            NotFoundError: If a parent path does not resolve to an item.
+        """
+        if not parent:
+            return None
+        if not isinstance(parent, str):
+            return parent
+
+        parent_item = self.navigator.get_item_by_path(parent)
+        if not parent_item:
+            raise NotFoundError(
+                f"Parent item not found at path: '{parent}'. "
+                f"Please verify the path is correct and the parent item exists."
+            )
+        return parent_item
+
     def _archive_completed_strategic_siblings(
         self, parent_item: BaseItem, item_type: str
     ) -> None:
@@ -148,7 +176,8 @@ class CRUDManager:
         if not hasattr(parent_item, "children"):
             return
 
-        for child in list(parent_item.children):
+        to_archive = []
+        for child in parent_item.children:
             if child.item_type == item_type and child.status == "completed":
                 # For objectives, verify execution tree is complete
                 if item_type == "objective":
@@ -156,12 +185,17 @@ class CRUDManager:
                         child, Objective
                     ) and not self._is_objective_exec_tree_complete(child):
                         continue  # Skip - has pending deliverables/actions
+                to_archive.append(child)
 
-                # Archive this item
-                self.archive_manager.archive_strategic_item(child, item_type)
-                # Remove from parent's active children
-                parent_item.children.remove(child)
-                click.echo(f"  ✓ Archived completed {item_type} '{child.name}'")
+        if not to_archive:
+            return
+
+        # Archive all of them with one write of the archive files
+        self.archive_manager.archive_strategic_items(to_archive)
+        for child in to_archive:
+            # Remove from parent's active children
+            parent_item.children.remove(child)
+            click.echo(f"  ✓ Archived completed {item_type} '{child.name}'")
 
     def _is_objective_exec_tree_complete(self, objective: Objective) -> bool:
         """Check if an objective's execution tree is complete.
@@ -172,43 +206,25 @@ class CRUDManager:
         Returns:
             True if all deliverables and actions are complete (or empty).
         """
-        if not objective.children:
-            return True
-
-        for deliverable in objective.children:
-            if deliverable.status != "completed":
-                return False
-            for action in deliverable.children:
-                if action.status != "completed":
-                    return False
-
-        return True
+        return self.task_manager.is_exec_tree_complete(objective)
 
     def _get_sibling_items(
-        self, parent_path: Optional[str], item_type: str
+        self, parent_item: Optional[BaseItem], item_type: str
     ) -> List[BaseItem]:
         """Get list of sibling items for slug uniqueness check.
 
         Args:
-            parent_path: Path to parent item, or None for top-level phases.
+            parent_item: Resolved parent item, or None for top-level phases.
             item_type: Type of item being added.
 
         Returns:
             List of sibling items.
 
         Raises:
-            NotFoundError: If parent item not found.
             InvalidOperationError: If parent-child relationship is invalid.
             ValueError: If adding non-phase item without parent.
         """
-        if parent_path:
-            parent_item = self.navigator.get_item_by_path(parent_path)
-            if not parent_item:
-                raise NotFoundError(
-                    f"Parent item not found at path: '{parent_path}'. "
-                    f"Please verify the path is correct and the parent item exists."
-                )
-
+        if parent_item:
             if item_type == "milestone" and isinstance(parent_item, Phase):
                 return parent_item.children
             elif item_type == "objective" and isinstance(parent_item, Milestone):
@@ -267,8 +283,7 @@ class CRUDManager:
         """
         # Convert to lowercase and replace spaces/special chars with hyphens
         slug = text.lower()
-        slug = re.sub(r"[^a-z0-9]+", "-", slug)
-        slug = re.sub(r"-+", "-", slug)
+        slug = _NON_SLUG_CHARS.sub("-", slug)
         slug = slug.strip("-")
 
         # Truncate to max length
@@ -368,16 +383,10 @@ class CRUDManager:
                 f"Items in 'archived' status cannot be modified to maintain historical accuracy."
             )
 
-        updated = False
-        if name is not None:
-            item_to_update.name = name
-            # Re-generate slug if name changes
-            siblings = self._get_parent_items_for_slug_check(path)
-            item_to_update.slug = self._generate_unique_slug(siblings, name)
-            updated = True
-        if description is not None:
-            item_to_update.description = description
-            updated = True
+        # Validate every input before touching the item, so a bad date or
+        # status neither leaves a half-applied update behind nor pays for
+        # slug regeneration first
+        parsed_date = None
         if due_date is not None and isinstance(item_to_update, (Action, Deliverable)):
             parsed_date = parse_date(due_date)
             if parsed_date is None:
@@ -386,25 +395,29 @@ class CRUDManager:
             is_valid, error_msg = validate_date_range(parsed_date)
             if not is_valid:
                 raise ValidationError(error_msg)
-
-            item_to_update.due_date = parsed_date
-            updated = True
-        if status is not None:
-            if status not in VALID_STATUSES:
-                raise ValidationError(
-                    f"Invalid status: '{status}'. Status must be one of: {', '.join(VALID_STATUSES)}."
-                )
-            item_to_update.status = status
-            updated = True
-
-        if updated:
-            item_to_update.updated_at = datetime.now()
-        else:
+        if status is not None and status not in VALID_STATUSES:
+            raise ValidationError(
+                f"Invalid status: '{status}'. Status must be one of: {', '.join(VALID_STATUSES)}."
+            )
+        if all(value is None for value in (name, description, parsed_date, status)):
             raise ValidationError(
                 "No update parameters provided. "
                 "Please specify at least one field to update: --name, --desc, --due-date, or --status."
             )
 
+        if name is not None:
+            item_to_update.name = name
+            # Re-generate slug if name changes
+            siblings = self._get_parent_items_for_slug_check(path)
+            item_to_update.slug = self._generate_unique_slug(siblings, name)
+        if description is not None:
+            item_to_update.description = description
+        if parsed_date is not None:
+            item_to_update.due_date = parsed_date
+        if status is not None:
+            item_to_update.status = status
+        item_to_update.updated_at = datetime.now()
+
         return item_to_update
 
     def delete_item(self, path: str) -> None:
@@ -489,11 +502,10 @@ class CRUDManager:
         Returns:
             List of sibling items.
         """
-        segments = path.split("/")
-        if len(segments) == 1:  # Top-level phase
+        parent_path, _, _ = path.rpartition("/")
+        if not parent_path:  # Top-level phase
             return self.project.phases
 
-        parent_path = "/".join(segments[:-1])
         parent_item = self.navigator.get_item_by_path(parent_path)
 
         if parent_item:
@@ -104,24 +104,26 @@ class NavigationManager:
         """
         self.project = project
 
-    def _resolve_path_segment(self, items: list, segment: str) -> Optional[object]:
-        """Resolve a path segment to a specific item.
+    def _resolve_path_segment(self, parent, segment: str) -> Optional[object]:
+        """Resolve a path segment to a specific child of parent.
 
         Args:
-            items: List of items to search in (can include ArchivedItem wrappers).
+            parent: Project or item whose children are searched (children
+                can include ArchivedItem wrappers).
             segment: Path segment to resolve (slug or index).
 
         Returns:
             Matching item or None if not found.
         """
         # Try to match by slug
-        for item in items:
-            if item.slug == segment:
-                return item
+        item = parent.get_child_by_slug(segment)
+        if item is not None:
+            return item
 
         # Try to match by index (e.g., "milestones/1")
         try:
             index = int(segment) - 1
+            items = parent.children
             if 0 <= index < len(items):
                 return items[index]
         except ValueError:
@@ -145,23 +147,19 @@ class NavigationManager:
             return None
 
         try:
-            segments = path.split("/")
-            current_items: list = list(self.project.phases)
-
-            target_item: Optional[object] = None
+            parent: object = self.project
+            rest = path
 
-            for i, segment in enumerate(segments):
-                found_item = self._resolve_path_segment(current_items, segment)
+            # Walk one segment at a time; only descend while segments remain
+            while True:
+                segment, separator, rest = rest.partition("/")
+                found_item = self._resolve_path_segment(parent, segment)
                 if not found_item:
                     return None
+                if not separator:
+                    return found_item
 
-                target_item = found_item
-
-                if i < len(segments) - 1:
-                    # Get children - all items now use .children property
-                    current_items = list(found_item.children)
-
-            return target_item
+                parent = found_item
         except Exception as e:
             raise NavigationError(f"Failed to resolve path '{path}': {e}")
 
@@ -451,17 +449,11 @@ class NavigationManager:
         # Try crud_context first
         context = self.get_crud_context()
         if context:
-            parts = context.split("/")
-            if len(parts) > 1:
-                return "/".join(parts[:-1])
-            return None
+            return context.rpartition("/")[0] or None
 
         # Fall back to task_cursor
         if self.project.task_cursor:
-            parts = self.project.task_cursor.split("/")
-            if len(parts) > 1:
-                return "/".join(parts[:-1])
-            return None
+            return self.project.task_cursor.rpartition("/")[0] or None
 
         return None
 
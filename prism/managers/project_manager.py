@@ -90,22 +90,20 @@ class ProjectManager:
         project.crud_context = cursor_file.crud_context
 
         def _load_strategic(item, parent, item_type):
-            """Load strategic item and its children, then fill in archived siblings."""
-            child_uuids = parent.child_uuids.copy()
+            """Load strategic item, then fill in archived siblings in one pass."""
             if item:
                 if isinstance(parent, Project) and isinstance(item, Phase):
                     parent.add_child(item)
                 else:
                     project.place_item(item)
-                child_uuids.remove(item.uuid)
 
             # Fill in archived siblings from child_uuids
-            for uuid in list(child_uuids):
-                if item and uuid == item.uuid:
-                    continue
-                archived = self.archive_manager.get_archived_item(uuid, item_type)
-                if archived:
-                    parent.add_child(archived)
+            archived = [
+                self.archive_manager.get_archived_item(uuid, item_type)
+                for uuid in parent.child_uuids
+                if not (item and uuid == item.uuid)
+            ]
+            parent.add_children([wrapper for wrapper in archived if wrapper])
 
         # Load phase (and archived siblings)
         _load_strategic(strategic.phase, project, "phase")
@@ -124,9 +122,8 @@ class ProjectManager:
 
         execution = self.storage.load_execution()
 
-        # Load execution items
-        for item in execution.deliverables + execution.actions:
-            project.place_item(item)
+        # Load execution items (mapped first, then attached to parents)
+        project.place_items(execution.deliverables + execution.actions)
 
         return project
 
@@ -136,10 +133,19 @@ class ProjectManager:
 
         Serializes active items to StrategicFile and ExecutionFile format.
         Archived items are NOT saved here - they're managed by ArchiveManager.
+        All files are written in one storage transaction: nothing is written
+        unless every file serializes, and the renames then run back-to-back.
+        A rename failure or crash part-way through can still leave some
+        files updated and others not.
 
         Args:
             project: Project object to save.
         """
+        with self.storage.transaction():
+            self._save(project)
+
+    def _save(self, project: Project) -> None:
+        """Write cursor, strategic and execution files for project."""
         # Save cursors first (before any early exits)
         cursor_file = CursorFile(
             task_cursor=project.task_cursor,
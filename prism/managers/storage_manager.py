@@ -4,13 +4,23 @@ Storage manager for the Prism CLI.
 Handles loading and saving of all JSON files in the .prism/ directory.
 """
 
-import json
 import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from prism.exceptions import StorageError
 from prism.models.bug import BugLog
@@ -24,6 +34,8 @@ from prism.models.files import (
     StrategicFile,
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class StorageManager:
     """
@@ -32,16 +44,38 @@ class StorageManager:
     Handles atomic writes to prevent data corruption.
     """
 
-    def __init__(self, prism_dir: Optional[Path] = None) -> None:
+    def __init__(self, prism_dir: Optional[Path] = None, durable: bool = False) -> None:
         """
         Initialize the StorageManager with a .prism/ directory path.
 
         Args:
             prism_dir: Path to the .prism/ directory. Defaults to .prism/ in current directory.
+            durable: Sync written files and their directory so saves survive
+                a power loss, not just a crash of this process.
         """
         self.prism_dir = prism_dir if prism_dir else Path(".prism")
+        self.durable = durable
         self.archive_dir = self.prism_dir / "archive"
         self.buglogs_dir = self.prism_dir / "buglogs"
+        # (temp_path, file_path) renames deferred by an open transaction()
+        self._pending: Optional[List[Tuple[str, Union[str, Path]]]] = None
+        # Paths found absent; cleared when this manager writes them. The
+        # manager is assumed to be the only writer to .prism/ while it lives.
+        self._missing: Set[str] = set()
+
+        # File locations are fixed for the manager's lifetime; join them once
+        # as plain strings so load/save skip per-call Path arithmetic.
+        root = os.fspath(self.prism_dir)
+        self._archive_root = os.path.join(root, "archive")
+        self._strategic_path = os.path.join(root, "strategic.json")
+        self._execution_path = os.path.join(root, "execution.json")
+        self._config_path = os.path.join(root, "config.json")
+        self._orphans_path = os.path.join(root, "orphans.json")
+        self._cursor_path = os.path.join(root, "cursor.json")
+        self._bugs_path = os.path.join(root, "bugs.json")
+        self._archived_strategic_path = os.path.join(
+            self._archive_root, "strategic.json"
+        )
         self._ensure_prism_dir()
 
     def _ensure_prism_dir(self) -> None:
@@ -50,12 +84,31 @@ class StorageManager:
         self.archive_dir.mkdir(exist_ok=True)
         self.buglogs_dir.mkdir(exist_ok=True)
 
-    def _atomic_write(self, file_path: Path, data: Dict[str, Any]) -> None:
-        """Write data to a JSON file atomically to prevent corruption.
+    def _save_model(self, file_path: str, model: BaseModel) -> None:
+        """Serialize a file model to JSON and write it atomically.
+
+        Uses the serializer pydantic builds once per model class, which
+        emits bytes directly instead of building an intermediate dict and
+        skips the type inference the generic to_json does on every call.
 
         Args:
             file_path: Path to the file to write.
-            data: Dictionary data to write as JSON.
+            model: File model to serialize.
+
+        Raises:
+            StorageError: If writing to file fails.
+        """
+        serializer = type(model).__pydantic_serializer__
+        self._atomic_write_bytes(file_path, serializer.to_json(model, indent=2))
+
+    def _atomic_write_bytes(
+        self, file_path: Union[str, Path], payload: bytes
+    ) -> None:
+        """Write already-encoded bytes to a file atomically.
+
+        Args:
+            file_path: Path to the file to write.
+            payload: Encoded file contents.
 
         Raises:
             StorageError: If writing to file fails.
@@ -65,9 +118,23 @@ class StorageManager:
         )
 
         try:
-            with os.fdopen(temp_fd, "w") as temp_file:
-                json.dump(data, temp_file, indent=2)
+            # Write straight to the descriptor mkstemp gave us; no file object
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(temp_fd, view):]
+                if self.durable:
+                    self._sync_file_data(temp_fd)
+            finally:
+                os.close(temp_fd)
+            if self._pending is not None:
+                self._supersede_pending(file_path)
+                self._pending.append((temp_path, file_path))
+                return
             os.replace(temp_path, file_path)
+            self._missing.discard(os.fspath(file_path))
+            if self.durable:
+                self._sync_directories([file_path])
         except Exception as e:
             try:
                 os.unlink(temp_path)
@@ -75,27 +142,137 @@ class StorageManager:
                 pass
             raise StorageError(f"Failed to write to {file_path}: {e}")
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes so they land together.
+
+        Writes made inside the block go to temp files only. When the block
+        exits normally the temp files are renamed into place back-to-back;
+        if it raises, they are discarded and no target file is touched.
+        A file written more than once keeps only its last contents and is
+        renamed once. Nested transactions join the outermost one. In durable
+        mode each directory is synced once for the whole batch, not once per
+        file.
+
+        Raises:
+            StorageError: If renaming a temp file into place fails.
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = []
+        try:
+            yield
+        except BaseException:
+            pending, self._pending = self._pending, None
+            self._discard(pending)
+            raise
+
+        pending, self._pending = self._pending, None
+        for index, (temp_path, file_path) in enumerate(pending):
+            try:
+                os.replace(temp_path, file_path)
+            except OSError as e:
+                self._discard(pending[index:])
+                raise StorageError(f"Failed to write to {file_path}: {e}")
+            self._missing.discard(os.fspath(file_path))
+
+        if self.durable and pending:
+            try:
+                self._sync_directories(path for _, path in pending)
+            except OSError as e:
+                raise StorageError(f"Failed to sync {self.prism_dir}: {e}")
+
+    def _supersede_pending(self, file_path: Union[str, Path]) -> None:
+        """Drop an earlier pending write to file_path; only the last one lands.
+
+        Repeated saves of one file inside a transaction then cost a single
+        rename at exit instead of one per save.
+        """
+        target = os.fspath(file_path)
+        for index, entry in enumerate(self._pending):
+            if os.fspath(entry[1]) == target:
+                del self._pending[index]
+                self._discard([entry])
+                return
+
+    @staticmethod
+    def _sync_file_data(fd: int) -> None:
+        """Flush a temp file's contents before it is renamed into place.
+
+        fdatasync skips timestamp-only metadata that fsync would also flush;
+        the size the rename depends on is still written. Platforms without
+        fdatasync fall back to fsync.
+        """
+        getattr(os, "fdatasync", os.fsync)(fd)
+
+    @staticmethod
+    def _sync_directories(file_paths: Iterable[Union[str, Path]]) -> None:
+        """fsync each distinct parent directory once so renames are durable."""
+        directories = {os.path.dirname(os.fspath(path)) for path in file_paths}
+        for directory in directories:
+            dir_fd = os.open(directory or ".", os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def _read_model(
+        self, file_path: str, model_cls: Type[ModelT], label: str
+    ) -> Optional[ModelT]:
+        """Read a JSON file whole and validate it into a model in one pass.
+
+        Args:
+            file_path: Path of the file to read.
+            model_cls: File model to validate the contents against.
+            label: File description used in error messages.
+
+        Returns:
+            The validated model, or None if the file does not exist.
+
+        Raises:
+            StorageError: If the file is not valid JSON for model_cls.
+        """
+        if file_path in self._missing:
+            return None
+
+        # EAFP: a single open() both probes for the file and reads it
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            self._missing.add(file_path)
+            return None
+
+        try:
+            # The class's prebuilt validator, minus model_validate_json's
+            # per-call Python wrapper
+            return model_cls.__pydantic_validator__.validate_json(raw)
+        except ValidationError as e:
+            raise StorageError(f"Failed to load {label}: {e}")
+
+    @staticmethod
+    def _discard(pending: List[Tuple[str, Union[str, Path]]]) -> None:
+        """Remove temp files of writes that will not be committed."""
+        for temp_path, _ in pending:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
     # =========================================================================
     # Strategic File (active)
     # =========================================================================
 
     def load_strategic(self) -> StrategicFile:
         """Load strategic.json and return as StrategicFile model."""
-        file_path = self.prism_dir / "strategic.json"
-        if not file_path.exists():
-            return StrategicFile()
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            return StrategicFile.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise StorageError(f"Failed to load strategic.json: {e}")
+        data = self._read_model(self._strategic_path, StrategicFile, "strategic.json")
+        return data if data is not None else StrategicFile()
 
     def save_strategic(self, data: StrategicFile) -> None:
         """Save StrategicFile model to strategic.json."""
-        file_path = self.prism_dir / "strategic.json"
-        self._atomic_write(file_path, data.model_dump(mode="json"))
+        self._save_model(self._strategic_path, data)
 
     # =========================================================================
     # Execution File (active)
@@ -103,21 +280,12 @@ class StorageManager:
 
     def load_execution(self) -> ExecutionFile:
         """Load execution.json and return as ExecutionFile model."""
-        file_path = self.prism_dir / "execution.json"
-        if not file_path.exists():
-            return ExecutionFile()
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            return ExecutionFile.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise StorageError(f"Failed to load execution.json: {e}")
+        data = self._read_model(self._execution_path, ExecutionFile, "execution.json")
+        return data if data is not None else ExecutionFile()
 
     def save_execution(self, data: ExecutionFile) -> None:
         """Save ExecutionFile model to execution.json."""
-        file_path = self.prism_dir / "execution.json"
-        self._atomic_write(file_path, data.model_dump(mode="json"))
+        self._save_model(self._execution_path, data)
 
     # =========================================================================
     # Config File
@@ -125,21 +293,12 @@ class StorageManager:
 
     def load_config(self) -> ConfigFile:
         """Load config.json and return as ConfigFile model."""
-        file_path = self.prism_dir / "config.json"
-        if not file_path.exists():
-            return ConfigFile()
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            return ConfigFile.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise StorageError(f"Failed to load config.json: {e}")
+        data = self._read_model(self._config_path, ConfigFile, "config.json")
+        return data if data is not None else ConfigFile()
 
     def save_config(self, data: ConfigFile) -> None:
         """Save ConfigFile model to config.json."""
-        file_path = self.prism_dir / "config.json"
-        self._atomic_write(file_path, data.model_dump(mode="json"))
+        self._save_model(self._config_path, data)
 
     # =========================================================================
     # Orphans File
@@ -147,21 +306,12 @@ class StorageManager:
 
     def load_orphans(self) -> OrphansFile:
         """Load orphans.json and return as OrphansFile model."""
-        file_path = self.prism_dir / "orphans.json"
-        if not file_path.exists():
-            return OrphansFile()
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            return OrphansFile.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise StorageError(f"Failed to load orphans.json: {e}")
+        data = self._read_model(self._orphans_path, OrphansFile, "orphans.json")
+        return data if data is not None else OrphansFile()
 
     def save_orphans(self, data: OrphansFile) -> None:
         """Save OrphansFile model to orphans.json."""
-        file_path = self.prism_dir / "orphans.json"
-        self._atomic_write(file_path, data.model_dump(mode="json"))
+        self._save_model(self._orphans_path, data)
 
     # =========================================================================
     # Archived Strategic File
@@ -169,21 +319,16 @@ class StorageManager:
 
     def load_archived_strategic(self) -> ArchivedStrategicFile:
         """Load archive/strategic.json and return as ArchivedStrategicFile model."""
-        file_path = self.archive_dir / "strategic.json"
-        if not file_path.exists():
-            return ArchivedStrategicFile()
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            return ArchivedStrategicFile.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise StorageError(f"Failed to load archived strategic.json: {e}")
+        data = self._read_model(
+            self._archived_strategic_path,
+            ArchivedStrategicFile,
+            "archived strategic.json",
+        )
+        return data if data is not None else ArchivedStrategicFile()
 
     def save_archived_strategic(self, data: ArchivedStrategicFile) -> None:
         """Save ArchivedStrategicFile model to archive/strategic.json."""
-        file_path = self.archive_dir / "strategic.json"
-        self._atomic_write(file_path, data.model_dump(mode="json"))
+        self._save_model(self._archived_strategic_path, data)
 
     # =========================================================================
     # Archived Execution Tree (per-objective)
@@ -200,16 +345,11 @@ class StorageManager:
         Returns:
             ExecutionFile model or None if not found.
         """
-        file_path = self.archive_dir / f"{objective_uuid}.exec.json"
-        if not file_path.exists():
-            return None
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            return ExecutionFile.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise StorageError(f"Failed to load archived execution tree: {e}")
+        return self._read_model(
+            os.path.join(self._archive_root, f"{objective_uuid}.exec.json"),
+            ExecutionFile,
+            "archived execution tree",
+        )
 
     def save_archived_execution_tree(
         self, objective_uuid: str, data: ExecutionFile
@@ -220,8 +360,9 @@ class StorageManager:
             objective_uuid: UUID of the archived objective.
             data: ExecutionFile model to save.
         """
-        file_path = self.archive_dir / f"{objective_uuid}.exec.json"
-        self._atomic_write(file_path, data.model_dump(mode="json"))
+        self._save_model(
+            os.path.join(self._archive_root, f"{objective_uuid}.exec.json"), data
+        )
 
     # =========================================================================
     # Cursor File
@@ -229,21 +370,12 @@ class StorageManager:
 
     def load_cursor(self) -> CursorFile:
         """Load cursor.json and return as CursorFile model."""
-        file_path = self.prism_dir / "cursor.json"
-        if not file_path.exists():
-            return CursorFile()
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            return CursorFile.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise StorageError(f"Failed to load cursor.json: {e}")
+        data = self._read_model(self._cursor_path, CursorFile, "cursor.json")
+        return data if data is not None else CursorFile()
 
     def save_cursor(self, data: CursorFile) -> None:
         """Save CursorFile model to cursor.json."""
-        file_path = self.prism_dir / "cursor.json"
-        self._atomic_write(file_path, data.model_dump(mode="json"))
+        self._save_model(self._cursor_path, data)
 
     # =========================================================================
     # Bugs File
@@ -251,21 +383,12 @@ class StorageManager:
 
     def load_bugs(self) -> BugsFile:
         """Load bugs.json and return as BugsFile model."""
-        file_path = self.prism_dir / "bugs.json"
-        if not file_path.exists():
-            return BugsFile()
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            return BugsFile.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            raise StorageError(f"Failed to load bugs.json: {e}")
+        data = self._read_model(self._bugs_path, BugsFile, "bugs.json")
+        return data if data is not None else BugsFile()
 
     def save_bugs(self, data: BugsFile) -> None:
         """Save BugsFile model to bugs.json."""
-        file_path = self.prism_dir / "bugs.json"
-        self._atomic_write(file_path, data.model_dump(mode="json"))
+        self._save_model(self._bugs_path, data)
 
     # =========================================================================
     # Bug Log Files
@@ -309,12 +432,11 @@ class StorageManager:
             StorageError: If the log file doesn't exist or can't be read
         """
         file_path = self.buglogs_dir / bug_id / f"{buglog.id}.log"
-        if not file_path.exists():
-            raise StorageError(f"Bug log file not found: {file_path}")
-
         try:
             with open(file_path, "r") as f:
                 return f.read()
+        except FileNotFoundError:
+            raise StorageError(f"Bug log file not found: {file_path}")
         except Exception as e:
             raise StorageError(f"Failed to read bug log {file_path}: {e}")
 
@@ -356,11 +478,10 @@ class StorageManager:
             StorageError: If the log file can't be deleted
         """
         file_path = self.buglogs_dir / bug_id / f"{buglog.id}.log"
-        if not file_path.exists():
-            return False
-
         try:
             file_path.unlink()
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             raise StorageError(f"Failed to delete bug log {file_path}: {e}")
@@ -10,8 +10,9 @@ Handles:
 """
 
 import re
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import click
 
@@ -41,6 +42,9 @@ from prism.models.base import (
 )
 from prism.models.project import Project
 
+# Runs of characters that may not appear in a slug
+_SLUG_INVALID_CHARS = re.compile(r"[^a-z0-9\-]+")
+
 
 class TaskManager:
     """
@@ -74,6 +78,37 @@ class TaskManager:
         self.navigator = navigator
         self._save_callback = save_callback
         self._round_precision = PERCENTAGE_ROUND_PRECISION
+        self._slug_max_length = get_slug_max_length()
+        self._slug_word_limit = get_slug_word_limit()
+        self._slug_filler_words = frozenset(get_slug_filler_words())
+        # While saves are deferred, _save only records that one is owed
+        self._defer_saves = False
+        self._save_owed = False
+
+    def _save(self) -> None:
+        """Persist the project now, or once at the end of a deferred block."""
+        if self._defer_saves:
+            self._save_owed = True
+        else:
+            self._save_callback()
+
+    @contextmanager
+    def _deferred_save(self) -> Iterator[None]:
+        """Collapse the saves of several task operations into one.
+
+        Each save rewrites every project file, so compound operations run
+        their steps inside this block and persist the final state once.
+        The owed save still happens if a later step raises, so earlier
+        steps are not lost.
+        """
+        self._defer_saves = True
+        try:
+            yield
+        finally:
+            self._defer_saves = False
+            if self._save_owed:
+                self._save_owed = False
+                self._save_callback()
 
     # =========================================================================
     # Task Operations
@@ -152,7 +187,7 @@ class TaskManager:
         action.status = "in-progress"
         action_path = self.navigator.get_item_path(action)
         self.project.task_cursor = action_path
-        self._save_callback()
+        self._save()
 
     def start_next_action(self) -> Optional[Action]:
         """Start the next pending action.
@@ -176,7 +211,7 @@ class TaskManager:
             self._start_action(next_pending_action)
         else:
             self.project.task_cursor = None
-            self._save_callback()
+            self._save()
 
         return next_pending_action
 
@@ -191,15 +226,17 @@ class TaskManager:
             return None
 
         current_action.status = "completed"
-        current_action.updated_at = datetime.now()
+        current_action.updated_at = now = datetime.now()
 
-        # Cascade completion up the tree
-        self._cascade_completion(current_action)
+        # Cascade completion up the tree, stamped with the same time
+        self._cascade_completion(current_action, now)
 
-        self._save_callback()
+        self._save()
         return current_action
 
-    def _cascade_completion(self, item: BaseItem) -> None:
+    def _cascade_completion(
+        self, item: BaseItem, now: Optional[datetime] = None
+    ) -> None:
         """Cascade completion status up the tree when all children are complete.
 
         When all actions in a deliverable are complete, mark deliverable complete.
@@ -211,17 +248,18 @@ class TaskManager:
 
         Args:
             item: The completed item.
+            now: Timestamp for parents marked complete. Defaults to the
+                current time, read once for the whole cascade.
         """
         # Get the parent of the completed item
         item_path = self.navigator.get_item_path(item)
         if not item_path:
             return
 
-        segments = item_path.split("/")
-        if len(segments) < 2:
+        parent_path, _, _ = item_path.rpartition("/")
+        if not parent_path:
             return  # Top-level item, no parent to update
 
-        parent_path = "/".join(segments[:-1])
         parent = self.navigator.get_item_by_path(parent_path)
         if not parent:
             return
@@ -245,15 +283,19 @@ class TaskManager:
         # If all children are complete, mark parent as complete and continue cascading
         # Only cascade up to objective level (not milestones or phases)
         if all_children_complete and parent.status != "completed":
+            if now is None:
+                now = datetime.now()
             parent.status = "completed"
-            parent.updated_at = datetime.now()
+            parent.updated_at = now
             click.echo(f"  ✓ {type(parent).__name__} '{parent.name}' marked complete")
 
             # Continue cascading only if parent is a deliverable (cascade to objective)
             if isinstance(parent, Deliverable):
-                self._cascade_completion(parent)
+                self._cascade_completion(parent, now)
 
-    def cascade_status_to_in_progress(self, item: BaseItem) -> None:
+    def cascade_status_to_in_progress(
+        self, item: BaseItem, now: Optional[datetime] = None
+    ) -> None:
         """Cascade status change to 'in-progress' up the tree when child added to completed parent.
 
         When a child is added to a completed milestone/objective/deliverable,
@@ -261,30 +303,33 @@ class TaskManager:
 
         Args:
             item: The item whose status changed to 'in-progress'.
+            now: Timestamp for reopened parents. Defaults to the current
+                time, read once for the whole cascade.
         """
         # Get the parent of the item
         item_path = self.navigator.get_item_path(item)
         if not item_path:
             return
 
-        segments = item_path.split("/")
-        if len(segments) < 2:
+        parent_path, _, _ = item_path.rpartition("/")
+        if not parent_path:
             return  # Top-level item, no parent to update
 
-        parent_path = "/".join(segments[:-1])
         parent = self.navigator.get_item_by_path(parent_path)
         if not parent:
             return
 
         # If parent is completed, change it to in-progress
         if parent.status == "completed":
+            if now is None:
+                now = datetime.now()
             parent.status = "in-progress"
-            parent.updated_at = datetime.now()
+            parent.updated_at = now
             click.echo(f"  ✓ {type(parent).__name__} '{parent.name}' changed to in-progress")
 
             # Continue cascading up to phase level
             if isinstance(parent, (Objective, Milestone)):
-                self.cascade_status_to_in_progress(parent)
+                self.cascade_status_to_in_progress(parent, now)
 
     def complete_current_and_start_next(
         self,
@@ -294,11 +339,12 @@ class TaskManager:
         Returns:
             Tuple of (completed_action, next_action)
         """
-        completed_action = self.complete_current_action()
-        if not completed_action:
-            return (None, None)
+        with self._deferred_save():
+            completed_action = self.complete_current_action()
+            if not completed_action:
+                return (None, None)
 
-        next_action = self.start_next_action()
+            next_action = self.start_next_action()
         return (completed_action, next_action)
 
     # =========================================================================
@@ -385,17 +431,20 @@ class TaskManager:
         Returns:
             True if all deliverables and actions are complete (or empty).
         """
-        if not objective.children:
+        deliverables = objective.children
+        if not deliverables:
             return True  # Empty tree is considered complete (ready for new items)
 
-        for deliverable in objective.children:
-            if deliverable.status != "completed":
-                return False
-            for action in deliverable.children:
-                if action.status != "completed":
-                    return False
+        # Deliverable statuses are a cheap first sweep: any open deliverable
+        # settles the answer without touching its actions.
+        if any(d.status != "completed" for d in deliverables):
+            return False
 
-        return True
+        return all(
+            action.status == "completed"
+            for deliverable in deliverables
+            for action in deliverable.children
+        )
 
     def get_completion_stats(self, item: BaseItem) -> Dict[str, int]:
         """Get completion statistics for an item.
@@ -450,9 +499,9 @@ class TaskManager:
         Returns:
             Unique slug string.
         """
-        max_length = get_slug_max_length()
-        word_limit = get_slug_word_limit()
-        filler_words = set(get_slug_filler_words())
+        max_length = self._slug_max_length
+        word_limit = self._slug_word_limit
+        filler_words = self._slug_filler_words
 
         # Split name into words, convert to lowercase
         words = base_name.lower().split()
@@ -466,7 +515,7 @@ class TaskManager:
 
         # Join with hyphens and remove non-alphanumeric chars
         base_slug = "-".join(filtered_words)
-        base_slug = re.sub(r"[^a-z0-9\-]+", "-", base_slug).strip("-")
+        base_slug = _SLUG_INVALID_CHARS.sub("-", base_slug).strip("-")
 
         # Truncate to max length
         base_slug = base_slug[:max_length]
@@ -46,6 +46,9 @@ class ArchivedItem:
         request_load_children: Emitted when children access requires loading.
     """
 
+    # Archives can hold many wrappers; slots drop the per-instance __dict__.
+    __slots__ = ("uuid", "item_type", "_wrapped_item", "_load_state", "_load_context")
+
     def __init__(self, uuid: str, item_type: str, **kwargs):
         """
         Initialize archived item wrapper.
@@ -260,6 +263,20 @@ class ArchivedItem:
             return self._wrapped_item.time_spent
         return None
 
+    def get_child_by_slug(self, slug: str) -> Optional[Any]:
+        """
+        Get a child item by slug.
+
+        Triggers load of item and children if not yet loaded.
+
+        Returns:
+            Matching child item, or None if not found.
+        """
+        self._ensure_children_loaded()
+        if self._wrapped_item:
+            return self._wrapped_item.get_child_by_slug(slug)
+        return None
+
     def add_child(self, child):
         if not self._load_state == LoadState.LOADED or not self._wrapped_item:
             raise ValueError("Tried to add child to unloaded item")
@@ -5,14 +5,46 @@ Common base for all strategic and execution items.
 """
 
 import re
+import sys
 import uuid
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
+def lookup_by_slug(items: List, index: Dict[str, int], slug: str) -> Any:
+    """Find the item with the given slug using index as a position cache.
+
+    index maps slugs to positions in items. A cached position is trusted
+    only if the item there still has that slug; otherwise (or on a miss)
+    the index is rebuilt in place. Callers may therefore mutate items and
+    rename slugs freely without invalidating the index themselves.
+
+    Args:
+        items: Ordered items to search (None entries are skipped).
+        index: Slug-to-position cache owned by the caller.
+        slug: Slug to find.
+
+    Returns:
+        First item with a matching slug, or None.
+    """
+    position = index.get(slug)
+    if position is not None and position < len(items):
+        item = items[position]
+        if item is not None and item.slug == slug:
+            return item
+
+    index.clear()
+    for position, item in enumerate(items):
+        if item is not None:
+            index.setdefault(item.slug, position)
+
+    position = index.get(slug)
+    return items[position] if position is not None else None
+
+
 class ItemStatus(str, Enum):
     """Valid status values for all items."""
 
@@ -39,7 +71,8 @@ class BaseItem(BaseModel):
     - time_spent: Total time spent on this item (cascades from children)
     - child_uuids: List of child UUIDs in order (for preserving order)
     
-    Subclasses override _item_type to specify their type for validation.
+    Subclasses override _item_type to specify their type and _check_child
+    to restrict which item types they accept as children.
     """
 
     uuid: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -53,6 +86,7 @@ class BaseItem(BaseModel):
     time_spent: Optional[timedelta] = None
     child_uuids: List[str] = Field(default_factory=list)
     _children: List[Optional["BaseItem"]] = PrivateAttr()
+    _slug_index: Dict[str, int] = PrivateAttr(default_factory=dict)
     _item_type: str = PrivateAttr(default="base")
 
     def model_post_init(self, __context) -> None:
@@ -80,6 +114,12 @@ class BaseItem(BaseModel):
         else:
             self.status = ItemStatus.PENDING.value
 
+    @field_validator("status")
+    @classmethod
+    def intern_status(cls, v: str) -> str:
+        """Intern status so loaded items share the few distinct status strings."""
+        return sys.intern(v)
+
     @field_validator("slug")
     @classmethod
     def validate_slug(cls, v: str) -> str:
@@ -101,6 +141,17 @@ class BaseItem(BaseModel):
         """
         return self._children
 
+    def get_child_by_slug(self, slug: str) -> Any:
+        """Get a child item by slug.
+
+        Args:
+            slug: Slug of the child to find.
+
+        Returns:
+            Matching child item, or None if not found.
+        """
+        return lookup_by_slug(self._children, self._slug_index, slug)
+
     def add_child(self, child) -> None:
         """Add a child item to this item.
 
@@ -108,11 +159,10 @@ class BaseItem(BaseModel):
         If the child's UUID is already in child_uuids, replaces the None
         at that index with the child. Otherwise appends to both lists.
 
-        Subclasses should override to add type validation before calling super().
-
         Args:
             child: Child item to add.
         """
+        self._check_child(child)
         if child.uuid not in self.child_uuids:
             self.child_uuids.append(child.uuid)
             self._children.append(child)
@@ -120,6 +170,34 @@ class BaseItem(BaseModel):
             index = self.child_uuids.index(child.uuid)
             self._children[index] = child
 
+    def add_children(self, children: List) -> None:
+        """Add several child items to this item in one pass.
+
+        Equivalent to calling add_child for each child, but builds the
+        uuid-to-index lookup once instead of scanning child_uuids per child.
+
+        Args:
+            children: Child items to add, in order.
+        """
+        positions = {uuid: i for i, uuid in enumerate(self.child_uuids)}
+        for child in children:
+            index = positions.get(child.uuid)
+            if index is None:
+                self.add_child(child)
+                positions[child.uuid] = len(self.child_uuids) - 1
+            else:
+                self._check_child(child)
+                self._children[index] = child
+
+    def _check_child(self, child) -> None:
+        """Validate that child may be added to this item.
+
+        Subclasses override to enforce their valid child type.
+
+        Args:
+            child: Child item to validate.
+        """
+
 
 # =============================================================================
 # Execution Items (defined first to resolve forward references)
@@ -135,7 +213,7 @@ class Action(BaseItem):
     due_date: Optional[datetime] = None
     _item_type: str = PrivateAttr(default="action")
 
-    def add_child(self, child) -> None:
+    def _check_child(self, child) -> None:
         """Actions cannot have children.
 
         Raises:
@@ -152,15 +230,14 @@ class Deliverable(BaseItem):
 
     _item_type: str = PrivateAttr(default="deliverable")
 
-    def add_child(self, child) -> None:
-        """Add an action to this deliverable.
+    def _check_child(self, child) -> None:
+        """Only actions may be added to a deliverable.
 
         Args:
-            child: Action to add.
+            child: Child item to validate.
         """
         if getattr(child, "item_type", None) != "action":
             raise ValueError("Deliverables can only have Actions as children")
-        super().add_child(child)
 
 
 # =============================================================================
@@ -176,15 +253,14 @@ class Objective(BaseItem):
 
     _item_type: str = PrivateAttr(default="objective")
 
-    def add_child(self, child) -> None:
-        """Add a deliverable to this objective.
+    def _check_child(self, child) -> None:
+        """Only deliverables may be added to an objective.
 
         Args:
-            child: Deliverable to add.
+            child: Child item to validate.
         """
         if getattr(child, "item_type", None) != "deliverable":
             raise ValueError("Objectives can only have Deliverables as children")
-        super().add_child(child)
 
 
 class Milestone(BaseItem):
@@ -195,15 +271,14 @@ class Milestone(BaseItem):
 
     _item_type: str = PrivateAttr(default="milestone")
 
-    def add_child(self, child) -> None:
-        """Add an objective to this milestone.
+    def _check_child(self, child) -> None:
+        """Only objectives may be added to a milestone.
 
         Args:
-            child: Objective to add.
+            child: Child item to validate.
         """
         if getattr(child, "item_type", None) != "objective":
             raise ValueError("Milestones can only have Objectives as children")
-        super().add_child(child)
 
 
 class Phase(BaseItem):
@@ -214,12 +289,11 @@ class Phase(BaseItem):
 
     _item_type: str = PrivateAttr(default="phase")
 
-    def add_child(self, child) -> None:
-        """Add a milestone to this phase.
+    def _check_child(self, child) -> None:
+        """Only milestones may be added to a phase.
 
         Args:
-            child: Milestone to add.
+            child: Child item to validate.
         """
         if getattr(child, "item_type", None) != "milestone":
             raise ValueError("Phases can only have Milestones as children")
-        super().add_child(child)
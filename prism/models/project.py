@@ -11,7 +11,7 @@ Archived items are represented as ArchivedItem wrappers for lazy loading.
 from typing import Dict, List
 
 from prism.models.archived import ArchivedItem
-from prism.models.base import BaseItem, Phase
+from prism.models.base import BaseItem, Phase, lookup_by_slug
 
 
 class Project:
@@ -28,9 +28,17 @@ class Project:
         self.child_uuids = child_uuids
         self.phases: List[BaseItem | ArchivedItem | None] = []
         self._id_map: Dict[str, BaseItem] = {}
+        self._slug_index: Dict[str, int] = {}
         self.task_cursor: str | None = None
         self.crud_context: str | None = None
 
+    @property
+    def children(self) -> List[BaseItem | ArchivedItem | None]:
+        return self.phases
+
+    def get_child_by_slug(self, slug: str) -> BaseItem | ArchivedItem | None:
+        return lookup_by_slug(self.phases, self._slug_index, slug)
+
     def add_child(self, item: Phase | ArchivedItem):
         if item.uuid not in self.child_uuids:
             self.child_uuids.append(item.uuid)
@@ -43,6 +51,19 @@ class Project:
             self.phases[index] = item
         self._map_item(item)
 
+    def add_children(self, items: List[Phase | ArchivedItem]):
+        positions = {uuid: i for i, uuid in enumerate(self.child_uuids)}
+        for item in items:
+            index = positions.get(item.uuid)
+            if index is None:
+                positions[item.uuid] = len(self.child_uuids)
+                self.add_child(item)
+                continue
+            while len(self.phases) <= index:
+                self.phases.append(None)
+            self.phases[index] = item
+            self._map_item(item)
+
     def _map_item(self, item: BaseItem | ArchivedItem):
         if isinstance(item, BaseItem) and item.uuid not in self._id_map:
             self._id_map[item.uuid] = item
@@ -56,5 +77,22 @@ class Project:
                 parent.add_child(item)
         self._map_item(item)
 
+    def place_items(self, items: List[BaseItem]):
+        """Place many items in two passes, independent of input order.
+
+        The first pass maps every item by UUID; the second groups items by
+        parent and attaches each group with a single add_children call.
+        """
+        for item in items:
+            self._map_item(item)
+
+        by_parent: Dict[str, List[BaseItem]] = {}
+        for item in items:
+            if item.parent_uuid and item.parent_uuid in self._id_map:
+                by_parent.setdefault(item.parent_uuid, []).append(item)
+
+        for parent_uuid, children in by_parent.items():
+            self._id_map[parent_uuid].add_children(children)
+
     def get_item(self, uuid: str) -> BaseItem | None:
         return self._id_map.get(uuid)
@@ -2,11 +2,88 @@
 Utility functions for the Prism CLI application.
 """
 
+from calendar import isleap
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import FrozenSet, List, Optional, Tuple
 
 from prism.constants import DATE_FORMATS, DATE_MAX_YEARS_FUTURE, DATE_MAX_YEARS_PAST
 
+# Separators of the supported YYYY?MM?DD formats. Strings in exactly that
+# shape skip the strptime table: no other supported format can match them,
+# and datetime.fromisoformat parses them far more cheaply.
+_YEAR_FIRST_SEPARATORS = frozenset(
+    separator for separator in "-/" if f"%Y{separator}%m{separator}%d" in DATE_FORMATS
+)
+
+
+def _parse_year_first(date_string: str) -> Optional[datetime]:
+    """
+    Parse a zero-padded YYYY-MM-DD or YYYY/MM/DD date string.
+
+    Args:
+        date_string: The date string to parse.
+
+    Returns:
+        A datetime object, or None if the string is not in one of those
+        shapes or is not a real date.
+    """
+    if len(date_string) != 10:
+        return None
+    separator = date_string[4]
+    if separator not in _YEAR_FIRST_SEPARATORS or date_string[7] != separator:
+        return None
+    try:
+        return datetime.fromisoformat(date_string.replace(separator, "-"))
+    except ValueError:
+        return None
+
+
+# Whether the supported formats include YYYYMMDD. An eight-digit string
+# can only split one way under it, so it is sliced directly.
+_COMPACT_SUPPORTED = "%Y%m%d" in DATE_FORMATS
+
+
+def _parse_compact(date_string: str) -> Optional[datetime]:
+    """
+    Parse a YYYYMMDD date string.
+
+    Args:
+        date_string: The date string to parse.
+
+    Returns:
+        A datetime object, or None if the string is not eight ASCII digits
+        or is not a real date.
+    """
+    if len(date_string) != 8 or not (date_string.isascii() and date_string.isdigit()):
+        return None
+    try:
+        return datetime(
+            int(date_string[:4]), int(date_string[4:6]), int(date_string[6:])
+        )
+    except ValueError:
+        return None
+
+
+# parse_date narrows DATE_FORMATS before calling strptime, since every
+# failed strptime call raises. Month-name formats need letters and the
+# numeric formats reject them; a numeric match is at most two characters
+# per directive (four for %Y) plus its separators, and every match
+# contains the separators its format does.
+_SEPARATORS = frozenset("-/,")
+_NAME_FORMATS: List[Tuple[str, FrozenSet[str]]] = [
+    (fmt, frozenset(fmt) & _SEPARATORS)
+    for fmt in DATE_FORMATS
+    if "%b" in fmt or "%B" in fmt
+]
+_NUMERIC_FORMATS: List[Tuple[str, FrozenSet[str]]] = [
+    (fmt, frozenset(fmt) & _SEPARATORS)
+    for fmt in DATE_FORMATS
+    if "%b" not in fmt and "%B" not in fmt
+]
+_NUMERIC_MAX_LENGTH = max(
+    (len(fmt) + 2 * fmt.count("%Y") for fmt, _ in _NUMERIC_FORMATS), default=0
+)
+
 
 def parse_date(date_string: str) -> Optional[datetime]:
     """
@@ -25,7 +102,25 @@ def parse_date(date_string: str) -> Optional[datetime]:
         >>> parse_date("31 December 2024")  # DD Month YYYY
         >>> parse_date("December 31, 2024")  # Month DD, YYYY
     """
-    for fmt in DATE_FORMATS:
+    parsed = _parse_year_first(date_string)
+    if parsed is not None:
+        return parsed
+    if _COMPACT_SUPPORTED:
+        parsed = _parse_compact(date_string)
+        if parsed is not None:
+            return parsed
+
+    if any(char.isalpha() for char in date_string):
+        candidates = _NAME_FORMATS
+    elif len(date_string) <= _NUMERIC_MAX_LENGTH:
+        candidates = _NUMERIC_FORMATS
+    else:
+        return None
+
+    present = set(date_string)
+    for fmt, separators in candidates:
+        if not separators <= present:
+            continue
         try:
             return datetime.strptime(date_string, fmt)
         except ValueError:
@@ -33,29 +128,54 @@ def parse_date(date_string: str) -> Optional[datetime]:
     return None
 
 
-def validate_date_range(date: datetime) -> Tuple[bool, Optional[str]]:
+def _same_day_years_apart(now: datetime, years: int) -> datetime:
+    """
+    Return midnight on now's calendar day, shifted by a number of years.
+    
+    Feb 29 maps to Feb 28 when the target year is not a leap year.
+    
+    Args:
+        now: The reference time.
+        years: Years to shift by; negative values shift into the past.
+        
+    Returns:
+        A datetime at midnight on the shifted day.
+    """
+    year = now.year + years
+    day = now.day
+    if day == 29 and now.month == 2 and not isleap(year):
+        day = 28
+    return datetime(year, now.month, day)
+
+
+def validate_date_range(
+    date: datetime, now: Optional[datetime] = None
+) -> Tuple[bool, Optional[str]]:
     """
     Validate that a date is within acceptable range.
     
     Args:
         date: The datetime object to validate.
+        now: Reference time the range is measured from. Defaults to the
+            current time; callers checking many dates can pass one value.
         
     Returns:
         A tuple of (is_valid, error_message). If valid, error_message is None.
     """
-    now = datetime.now()
-    min_date = datetime(now.year - DATE_MAX_YEARS_PAST, now.month, now.day)
-    max_date = datetime(now.year + DATE_MAX_YEARS_FUTURE, now.month, now.day)
+    if now is None:
+        now = datetime.now()
+    min_date = _same_day_years_apart(now, -DATE_MAX_YEARS_PAST)
+    max_date = _same_day_years_apart(now, DATE_MAX_YEARS_FUTURE)
     
     if date < min_date:
         return False, (
-            f"Date {date.strftime('%Y-%m-%d')} is too far in the past. "
+            f"Date {format_date(date)} is too far in the past. "
             f"Dates must be within the last {DATE_MAX_YEARS_PAST} year."
         )
     
     if date > max_date:
         return False, (
-            f"Date {date.strftime('%Y-%m-%d')} is too far in the future. "
+            f"Date {format_date(date)} is too far in the future. "
             f"Dates must be within the next {DATE_MAX_YEARS_FUTURE} years."
         )
     
@@ -72,4 +192,6 @@ def format_date(date: datetime) -> str:
     Returns:
         A string in YYYY-MM-DD format.
     """
-    return date.strftime("%Y-%m-%d")
+    # datetime.isoformat is C-level field formatting; strftime goes through
+    # the platform's locale-aware implementation, which is several times slower
+    return date.date().isoformat()
@@ -5,16 +5,20 @@ Provides:
 - Temporary directory fixtures (isolated from project .prism/)
 - Mock data builders for creating test items
 - Helper functions for common test operations
+
+Session-scoped fixtures (item templates, read_only_project) are shared
+and must never be mutated; every fixture that tests change is built per
+test, so tests stay independent of order and of which worker runs them.
 """
 
-import shutil
-import tempfile
+import itertools
 from datetime import datetime
 from pathlib import Path
 from typing import Generator, Optional
 
 import pytest
 
+from prism.managers.storage_manager import StorageManager
 from prism.models.base import (
     Action,
     Deliverable,
@@ -35,16 +39,28 @@ from prism.models.project import Project
 # =============================================================================
 
 
+_temp_dir_counter = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def _base_temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide parent for per-test temporary directories.
+
+    pytest owns this directory and prunes it across sessions, so tests
+    only pay for a single mkdir each instead of mkdtemp plus rmtree.
+    """
+    return tmp_path_factory.mktemp("prism_test")
+
+
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir(_base_temp_dir: Path) -> Path:
     """Create a temporary directory for test isolation.
 
     Ensures tests don't modify the project's actual .prism/ directory.
     """
-    temp_path = Path(tempfile.mkdtemp(prefix="prism_test_"))
-    yield temp_path
-    # Cleanup
-    shutil.rmtree(temp_path, ignore_errors=True)
+    temp_path = _base_temp_dir / f"t{next(_temp_dir_counter)}"
+    temp_path.mkdir()
+    return temp_path
 
 
 @pytest.fixture
@@ -68,6 +84,12 @@ def empty_prism_dir(temp_dir: Path) -> Generator[Path, None, None]:
     yield prism_path
 
 
+@pytest.fixture
+def storage_manager(empty_prism_dir: Path) -> StorageManager:
+    """Create a StorageManager bound to an empty .prism/ directory."""
+    return StorageManager(empty_prism_dir)
+
+
 # =============================================================================
 # Mock Data Builders
 # =============================================================================
@@ -176,14 +198,40 @@ def mock_data() -> MockDataBuilder:
     return MockDataBuilder()
 
 
+# Session-wide strategic item prototypes. Tests clone them with
+# model_copy(update=...) rather than mutating them, which skips building
+# and validating a fresh model per test.
+
+
+@pytest.fixture(scope="session")
+def phase_template() -> Phase:
+    """Shared Phase prototype; clone with model_copy, never mutate."""
+    return MockDataBuilder.create_phase(name="Template Phase", slug="template-phase")
+
+
+@pytest.fixture(scope="session")
+def milestone_template() -> Milestone:
+    """Shared Milestone prototype; clone with model_copy, never mutate."""
+    return MockDataBuilder.create_milestone(
+        name="Template Milestone", slug="template-milestone"
+    )
+
+
+@pytest.fixture(scope="session")
+def objective_template() -> Objective:
+    """Shared Objective prototype; clone with model_copy, never mutate."""
+    return MockDataBuilder.create_objective(
+        name="Template Objective", slug="template-objective"
+    )
+
+
 # =============================================================================
 # Project Structure Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def sample_project(mock_data: MockDataBuilder) -> Project:
-    """Create a sample project with a full hierarchy for testing.
+def build_sample_project() -> Project:
+    """Build a sample project with a full hierarchy for testing.
 
     Structure:
         Phase 1
@@ -198,11 +246,13 @@ def sample_project(mock_data: MockDataBuilder) -> Project:
     project = Project([])
 
     # Create phase
-    phase = mock_data.create_phase(name="Phase 1", slug="phase-1", uuid="phase-1-uuid")
+    phase = MockDataBuilder.create_phase(
+        name="Phase 1", slug="phase-1", uuid="phase-1-uuid"
+    )
     project.add_child(phase)
 
     # Create milestone
-    milestone = mock_data.create_milestone(
+    milestone = MockDataBuilder.create_milestone(
         name="Milestone 1",
         slug="milestone-1",
         parent_uuid=phase.uuid,
@@ -211,7 +261,7 @@ def sample_project(mock_data: MockDataBuilder) -> Project:
     project.place_item(milestone)
 
     # Create objective
-    objective = mock_data.create_objective(
+    objective = MockDataBuilder.create_objective(
         name="Objective 1",
         slug="objective-1",
         parent_uuid=milestone.uuid,
@@ -220,13 +270,13 @@ def sample_project(mock_data: MockDataBuilder) -> Project:
     project.place_item(objective)
 
     # Create deliverables
-    deliv1 = mock_data.create_deliverable(
+    deliv1 = MockDataBuilder.create_deliverable(
         name="Deliverable 1",
         slug="deliverable-1",
         parent_uuid=objective.uuid,
         uuid="deliverable-1-uuid",
     )
-    deliv2 = mock_data.create_deliverable(
+    deliv2 = MockDataBuilder.create_deliverable(
         name="Deliverable 2",
         slug="deliverable-2",
         parent_uuid=objective.uuid,
@@ -236,19 +286,19 @@ def sample_project(mock_data: MockDataBuilder) -> Project:
     project.place_item(deliv2)
 
     # Create actions
-    action1 = mock_data.create_action(
+    action1 = MockDataBuilder.create_action(
         name="Action 1",
         slug="action-1",
         parent_uuid=deliv1.uuid,
         uuid="action-1-uuid",
     )
-    action2 = mock_data.create_action(
+    action2 = MockDataBuilder.create_action(
         name="Action 2",
         slug="action-2",
         parent_uuid=deliv1.uuid,
         uuid="action-2-uuid",
     )
-    action3 = mock_data.create_action(
+    action3 = MockDataBuilder.create_action(
         name="Action 3",
         slug="action-3",
         parent_uuid=deliv2.uuid,
@@ -261,6 +311,22 @@ def sample_project(mock_data: MockDataBuilder) -> Project:
     return project
 
 
+@pytest.fixture
+def sample_project() -> Project:
+    """Create a fresh sample project (see build_sample_project)."""
+    return build_sample_project()
+
+
+@pytest.fixture(scope="session")
+def read_only_project() -> Project:
+    """Session-wide sample project for tests that only read the tree.
+
+    Never mutate it; tests that change items or the cursor must use
+    sample_project instead.
+    """
+    return build_sample_project()
+
+
 @pytest.fixture
 def empty_project() -> Project:
     """Create an empty project with no items."""
@@ -381,6 +447,23 @@ def build_path(project: Project, slugs: list) -> str:
     return "/".join(slugs)
 
 
+def mark_completed(item) -> None:
+    """Mark an item and its whole subtree completed, without cascading.
+
+    Every node gets the same updated_at, as a real cascade would stamp.
+
+    Args:
+        item: Root of the subtree to complete.
+    """
+    now = datetime.now()
+    stack = [item]
+    while stack:
+        node = stack.pop()
+        node.status = "completed"
+        node.updated_at = now
+        stack.extend(node.children)
+
+
 @pytest.fixture
 def helpers():
     """Provide helper functions for tests."""
@@ -388,4 +471,5 @@ def helpers():
         "count_items": count_items,
         "get_item_by_slug": get_item_by_slug,
         "build_path": build_path,
+        "mark_completed": mark_completed,
     }
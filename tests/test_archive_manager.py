@@ -117,6 +117,65 @@ class TestArchiveStrategicItem:
         assert len(archived.phases) == 1
         assert archived.phases[0].slug == "phase"
 
+    def test_archive_phase_keeps_descendant_order(
+        self, empty_prism_dir: Path, mock_data
+    ):
+        """Archived milestones and objectives keep their tree order."""
+        storage = StorageManager(empty_prism_dir)
+        manager = ArchiveManager(storage)
+
+        phase = mock_data.create_phase(uuid="phase-uuid")
+        for i in (1, 2):
+            milestone = mock_data.create_milestone(
+                slug=f"milestone-{i}", parent_uuid=phase.uuid, uuid=f"m{i}-uuid"
+            )
+            milestone.add_child(
+                mock_data.create_objective(
+                    slug=f"objective-{i}",
+                    parent_uuid=milestone.uuid,
+                    uuid=f"o{i}-uuid",
+                )
+            )
+            phase.add_child(milestone)
+
+        manager.archive_strategic_item(phase, "phase")
+
+        archived = storage.load_archived_strategic()
+        assert [m.uuid for m in archived.milestones] == ["m1-uuid", "m2-uuid"]
+        assert [o.uuid for o in archived.objectives] == ["o1-uuid", "o2-uuid"]
+        assert all(o.status == "archived" for o in archived.objectives)
+
+    def test_archive_items_batch_saves_strategic_once(
+        self, empty_prism_dir: Path, mock_data, monkeypatch
+    ):
+        """Archiving several items writes archive/strategic.json once."""
+        storage = StorageManager(empty_prism_dir)
+        manager = ArchiveManager(storage)
+        saves = []
+        save = storage.save_archived_strategic
+        monkeypatch.setattr(
+            storage,
+            "save_archived_strategic",
+            lambda archived: saves.append(archived) or save(archived),
+        )
+
+        objectives = [
+            mock_data.create_objective(slug=f"objective-{i}", uuid=f"obj-{i}-uuid")
+            for i in range(3)
+        ]
+
+        manager.archive_strategic_items(objectives)
+
+        assert len(saves) == 1
+        archived = storage.load_archived_strategic()
+        assert [o.uuid for o in archived.objectives] == [
+            "obj-0-uuid",
+            "obj-1-uuid",
+            "obj-2-uuid",
+        ]
+        for objective in objectives:
+            assert storage.load_archived_execution_tree(objective.uuid) is not None
+
 
 class TestArchiveExecutionTree:
     """Test archiving execution trees."""
@@ -9,7 +9,10 @@ Tests cover:
 - Depth-first path validation
 """
 
+import pytest
+
 from prism.managers.navigation_manager import SPECIAL_TOKENS, NavigationManager
+from prism.models.base import Action, Deliverable, Milestone, Objective, Phase
 
 
 class TestNavigationManagerInit:
@@ -24,47 +27,88 @@ class TestNavigationManagerInit:
 class TestPathResolution:
     """Test path resolution methods."""
 
-    def test_get_item_by_path_full_path(self, sample_project):
-        """Get item by full path string."""
-        nav = NavigationManager(sample_project)
-
-        action = nav.get_item_by_path(
-            "phase-1/milestone-1/objective-1/deliverable-1/action-1"
-        )
-
-        assert action is not None
-        assert action.name == "Action 1"
-
-    def test_get_item_by_path_not_found(self, sample_project):
+    @pytest.mark.parametrize(
+        "path,name,item_type",
+        [
+            ("phase-1", "Phase 1", Phase),
+            ("phase-1/milestone-1", "Milestone 1", Milestone),
+            ("phase-1/milestone-1/objective-1", "Objective 1", Objective),
+            (
+                "phase-1/milestone-1/objective-1/deliverable-1",
+                "Deliverable 1",
+                Deliverable,
+            ),
+            (
+                "phase-1/milestone-1/objective-1/deliverable-1/action-1",
+                "Action 1",
+                Action,
+            ),
+        ],
+    )
+    def test_get_item_by_path_each_level(
+        self, read_only_project, path, name, item_type
+    ):
+        """Get item by path string at every level of the tree."""
+        nav = NavigationManager(read_only_project)
+
+        item = nav.get_item_by_path(path)
+
+        assert isinstance(item, item_type)
+        assert item.name == name
+
+    def test_get_item_by_path_not_found(self, read_only_project):
         """Get item returns None for invalid path."""
-        nav = NavigationManager(sample_project)
+        nav = NavigationManager(read_only_project)
 
         result = nav.get_item_by_path("invalid/path/here")
 
         assert result is None
 
-    def test_get_item_by_path_empty(self, sample_project):
+    def test_get_item_by_path_empty(self, read_only_project):
         """Get item returns None for empty path."""
-        nav = NavigationManager(sample_project)
+        nav = NavigationManager(read_only_project)
 
         result = nav.get_item_by_path("")
 
         assert result is None
 
-    def test_get_item_path(self, sample_project):
-        """Get path string from item."""
+    def test_get_item_by_path_index_segment(self, read_only_project):
+        """Numeric segments resolve by 1-based position."""
+        nav = NavigationManager(read_only_project)
+
+        deliverable = nav.get_item_by_path("1/1/1/2")
+
+        assert deliverable.slug == "deliverable-2"
+
+    def test_get_item_by_path_after_slug_change(self, sample_project):
+        """Slug lookups stay correct after a child is renamed or removed."""
         nav = NavigationManager(sample_project)
+        objective_path = "phase-1/milestone-1/objective-1"
+        deliverable = nav.get_item_by_path(f"{objective_path}/deliverable-1")
+
+        deliverable.slug = "renamed"
+        assert nav.get_item_by_path(f"{objective_path}/deliverable-1") is None
+        assert nav.get_item_by_path(f"{objective_path}/renamed") is deliverable
 
-        phase = sample_project.phases[0]
+        objective = nav.get_item_by_path(objective_path)
+        objective.children.remove(deliverable)
+        assert nav.get_item_by_path(f"{objective_path}/renamed") is None
+        assert nav.get_item_by_path(f"{objective_path}/deliverable-2") is not None
+
+    def test_get_item_path(self, read_only_project):
+        """Get path string from item."""
+        nav = NavigationManager(read_only_project)
+
+        phase = read_only_project.phases[0]
         path = nav.get_item_path(phase)
 
         assert path == "phase-1"
 
-    def test_get_item_path_nested(self, sample_project):
+    def test_get_item_path_nested(self, read_only_project):
         """Get path for deeply nested item."""
-        nav = NavigationManager(sample_project)
+        nav = NavigationManager(read_only_project)
 
-        phase = sample_project.phases[0]
+        phase = read_only_project.phases[0]
         milestone = phase.children[0]
         objective = milestone.children[0]
         deliverable = objective.children[0]
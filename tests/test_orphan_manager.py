@@ -9,12 +9,11 @@ Tests cover:
 """
 
 import json
+
 import pytest
 
 from prism.managers.orphan_manager import OrphanManager
 from prism.managers.storage_manager import StorageManager
-from prism.models.files import OrphansFile
-from prism.models.orphan import Orphan
 
 
 @pytest.fixture
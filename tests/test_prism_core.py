@@ -9,7 +9,10 @@ Tests cover:
 
 from pathlib import Path
 
+import pytest
+
 from prism.core import PrismCore
+from prism.exceptions import StorageError
 
 # =============================================================================
 # PrismCore Initialization Tests
@@ -44,6 +47,18 @@ class TestPrismCoreInit:
         assert core.project.task_cursor is None
         assert core.project.crud_context is None
 
+    def test_init_defers_project_load(self, temp_dir: Path):
+        """PrismCore reads project files only when the project is first used."""
+        prism_dir = temp_dir / ".prism"
+        prism_dir.mkdir()
+        (prism_dir / "strategic.json").write_text("not valid json")
+
+        core = PrismCore(prism_dir)
+        assert core.list_orphans() == []
+
+        with pytest.raises(StorageError):
+            core.project
+
     def test_init_default_path(self):
         """PrismCore uses .prism/ in current directory by default."""
         # This may fail if .prism doesn't exist, so just check it initializes
@@ -124,6 +139,21 @@ class TestPrismCoreCrud:
         action_path = f"{phase.slug}/{milestone.slug}/{objective.slug}/{deliverable.slug}/{action.slug}"
         assert core.get_item_by_path(action_path) is not None
 
+    def test_add_item_with_parent_object(self, temp_dir: Path):
+        """Parents can be passed as items instead of paths."""
+        prism_dir = temp_dir / ".prism"
+        prism_dir.mkdir()
+        (prism_dir / "archive").mkdir()
+
+        core = PrismCore(prism_dir)
+
+        phase = core.add_item("phase", "Phase", "Desc", None)
+        milestone = core.add_item("milestone", "Milestone", "Desc", phase)
+        objective = core.add_item("objective", "Objective", "Desc", milestone)
+
+        assert objective.parent_uuid == milestone.uuid
+        assert core.get_item_by_path("phase/milestone/objective") is objective
+
     def test_update_item(self, temp_dir: Path):
         """Update item through PrismCore."""
         prism_dir = temp_dir / ".prism"
@@ -280,3 +280,43 @@ class TestProjectPlaceItem:
         sample_project.place_item(action)
 
         assert sample_project.get_item(action.uuid) is action
+
+    def test_place_items_is_order_independent(self, sample_project):
+        """place_items attaches children even when listed before their parent."""
+        from prism.models.base import Action, Deliverable
+
+        deliverable = Deliverable(
+            name="New Deliverable",
+            slug="new-deliverable",
+            parent_uuid="objective-1-uuid",
+        )
+        action = Action(
+            name="New Action",
+            slug="new-action",
+            parent_uuid=deliverable.uuid,
+        )
+
+        sample_project.place_items([action, deliverable])
+
+        objective = sample_project.get_item("objective-1-uuid")
+        assert deliverable in objective.children
+        assert deliverable.children == [action]
+        assert sample_project.get_item(action.uuid) is action
+
+
+class TestProjectLoadStatus:
+    """Test status values on loaded items."""
+
+    def test_loaded_status_strings_are_interned(
+        self, empty_prism_dir: Path, sample_project
+    ):
+        """Loaded items share one string object per distinct status."""
+        storage = StorageManager(empty_prism_dir)
+        manager = ProjectManager(storage, ArchiveManager(storage))
+        manager.save(sample_project)
+
+        loaded = manager.load()
+
+        phase = loaded.phases[0]
+        milestone = phase.children[0]
+        assert phase.status is milestone.status
@@ -9,21 +9,42 @@ Tests cover:
 """
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from prism.exceptions import StorageError
 from prism.managers.storage_manager import StorageManager
+from prism.models.bug import BugLog
 from prism.models.files import (
     ArchivedStrategicFile,
     ConfigFile,
     CursorFile,
     ExecutionFile,
+    OrphansFile,
     StrategicFile,
 )
 
 
+def encode(data: dict) -> bytes:
+    """Encode plain test data as a JSON payload for _atomic_write_bytes."""
+    return json.dumps(data).encode()
+
+
+@pytest.fixture(scope="module")
+def read_only_storage_manager(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> StorageManager:
+    """StorageManager over an empty .prism/ shared by tests that only load.
+
+    Tests using it must not write; anything that saves takes the
+    per-test storage_manager fixture instead.
+    """
+    return StorageManager(tmp_path_factory.mktemp("prism_ro") / ".prism")
+
+
 class TestStorageManagerInit:
     """Test StorageManager initialization."""
 
@@ -36,8 +57,11 @@ class TestStorageManagerInit:
         assert prism_path.exists()
         assert (prism_path / "archive").exists()
 
-    def test_init_default_path(self):
+    def test_init_default_path(self, temp_dir: Path, monkeypatch):
         """StorageManager uses .prism/ in current dir by default."""
+        # Run from a private cwd so the default .prism/ never lands in the
+        # checkout or collides with other test processes.
+        monkeypatch.chdir(temp_dir)
         manager = StorageManager()
         assert manager.prism_dir == Path(".prism")
 
@@ -51,279 +75,473 @@ class TestStorageManagerInit:
 class TestStrategicFileOperations:
     """Test strategic.json operations."""
 
-    def test_load_strategic_empty(self, empty_prism_dir: Path):
+    def test_load_strategic_empty(self, read_only_storage_manager: StorageManager):
         """Load strategic.json returns empty StrategicFile when file doesn't exist."""
-        manager = StorageManager(empty_prism_dir)
-        result = manager.load_strategic()
+        result = read_only_storage_manager.load_strategic()
         
         assert isinstance(result, StrategicFile)
         assert result.phase is None
         assert result.milestone is None
         assert result.objective is None
 
-    def test_save_and_load_strategic(
-        self, empty_prism_dir: Path, strategic_file: StrategicFile
+    def test_strategic_file_persists_correctly(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
     ):
-        """Save and load strategic.json preserves data."""
-        manager = StorageManager(empty_prism_dir)
-        
-        # Save
-        manager.save_strategic(strategic_file)
-        
-        # Load
-        result = manager.load_strategic()
-        
-        assert result.phase is not None
-        assert result.phase.name == strategic_file.phase.name
-        assert result.milestone is not None
-        assert result.objective is not None
-
-    def test_strategic_file_persists_correctly(self, empty_prism_dir: Path):
         """Strategic file is saved with correct JSON structure."""
-        manager = StorageManager(empty_prism_dir)
         strategic = StrategicFile(phase_uuids=["uuid-1", "uuid-2"])
         
-        manager.save_strategic(strategic)
-        
-        # Read raw JSON
-        file_path = empty_prism_dir / "strategic.json"
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        storage_manager.save_strategic(strategic)
         
-        assert "phase_uuids" in data
-        assert data["phase_uuids"] == ["uuid-1", "uuid-2"]
+        # Read raw JSON; one parse checks the whole document shape
+        raw = (empty_prism_dir / "strategic.json").read_bytes()
+
+        assert json.loads(raw) == {
+            "phase": None,
+            "milestone": None,
+            "objective": None,
+            "phase_uuids": ["uuid-1", "uuid-2"],
+        }
 
 
 class TestExecutionFileOperations:
     """Test execution.json operations."""
 
-    def test_load_execution_empty(self, empty_prism_dir: Path):
+    def test_load_execution_empty(self, read_only_storage_manager: StorageManager):
         """Load execution.json returns empty ExecutionFile when file doesn't exist."""
-        manager = StorageManager(empty_prism_dir)
-        result = manager.load_execution()
+        result = read_only_storage_manager.load_execution()
         
         assert isinstance(result, ExecutionFile)
         assert len(result.deliverables) == 0
         assert len(result.actions) == 0
 
-    def test_save_and_load_execution(
-        self, empty_prism_dir: Path, execution_file: ExecutionFile
-    ):
-        """Save and load execution.json preserves data."""
-        manager = StorageManager(empty_prism_dir)
-        
-        # Save
-        manager.save_execution(execution_file)
-        
-        # Load
-        result = manager.load_execution()
-        
-        assert len(result.deliverables) == len(execution_file.deliverables)
-        assert len(result.actions) == len(execution_file.actions)
-
 
 class TestCursorFileOperations:
     """Test cursor.json operations."""
 
-    def test_load_cursor_empty(self, empty_prism_dir: Path):
+    def test_load_cursor_empty(self, read_only_storage_manager: StorageManager):
         """Load cursor.json returns empty CursorFile when file doesn't exist."""
-        manager = StorageManager(empty_prism_dir)
-        result = manager.load_cursor()
+        result = read_only_storage_manager.load_cursor()
         
         assert isinstance(result, CursorFile)
         assert result.task_cursor is None
         assert result.crud_context is None
 
-    def test_save_and_load_cursor(self, empty_prism_dir: Path):
-        """Save and load cursor.json preserves data."""
-        manager = StorageManager(empty_prism_dir)
-        cursor = CursorFile(
-            task_cursor="phase-1/milestone-1/objective-1/deliverable-1/action-1",
-            crud_context="phase-1/milestone-1/objective-1/deliverable-1",
-        )
-        
-        # Save
-        manager.save_cursor(cursor)
-        
-        # Load
-        result = manager.load_cursor()
-        
-        assert result.task_cursor == cursor.task_cursor
-        assert result.crud_context == cursor.crud_context
-
-    def test_cursor_file_persists_correctly(self, empty_prism_dir: Path):
+    def test_cursor_file_persists_correctly(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
         """Cursor file is saved with correct JSON structure."""
-        manager = StorageManager(empty_prism_dir)
         cursor = CursorFile(task_cursor="test-path", crud_context="test-context")
         
-        manager.save_cursor(cursor)
-        
-        # Read raw JSON
-        file_path = empty_prism_dir / "cursor.json"
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        storage_manager.save_cursor(cursor)
         
-        assert data["task_cursor"] == "test-path"
-        assert data["crud_context"] == "test-context"
+        # Read raw JSON; one parse checks the whole document shape
+        raw = (empty_prism_dir / "cursor.json").read_bytes()
+
+        assert json.loads(raw) == {
+            "task_cursor": "test-path",
+            "crud_context": "test-context",
+        }
 
 
 class TestConfigFileOperations:
     """Test config.json operations."""
 
-    def test_load_config_empty(self, empty_prism_dir: Path):
+    def test_load_config_empty(self, read_only_storage_manager: StorageManager):
         """Load config.json returns empty ConfigFile when file doesn't exist."""
-        manager = StorageManager(empty_prism_dir)
-        result = manager.load_config()
+        result = read_only_storage_manager.load_config()
         
         assert isinstance(result, ConfigFile)
         assert result.schema_version == "0.2.0"
 
-    def test_save_and_load_config(self, empty_prism_dir: Path):
-        """Save and load config.json preserves data."""
-        manager = StorageManager(empty_prism_dir)
-        config = ConfigFile(
-            slug_max_length=20,
-            slug_word_limit=5,
-            status_header_width=30,
-        )
-        
-        # Save
-        manager.save_config(config)
-        
-        # Load
-        result = manager.load_config()
-        
-        assert result.slug_max_length == 20
-        assert result.slug_word_limit == 5
-        assert result.status_header_width == 30
-
 
 class TestArchivedStrategicFileOperations:
     """Test archive/strategic.json operations."""
 
-    def test_load_archived_strategic_empty(self, empty_prism_dir: Path):
+    def test_load_archived_strategic_empty(
+        self, read_only_storage_manager: StorageManager
+    ):
         """Load archived strategic.json returns empty when file doesn't exist."""
-        manager = StorageManager(empty_prism_dir)
-        result = manager.load_archived_strategic()
+        result = read_only_storage_manager.load_archived_strategic()
         
         assert isinstance(result, ArchivedStrategicFile)
         assert len(result.phases) == 0
         assert len(result.milestones) == 0
         assert len(result.objectives) == 0
 
-    def test_save_and_load_archived_strategic(self, empty_prism_dir: Path, mock_data):
-        """Save and load archived strategic.json preserves data."""
-        manager = StorageManager(empty_prism_dir)
-        
-        # Create archived items
-        archived = ArchivedStrategicFile(
-            phases=[mock_data.create_phase(name="Archived Phase", slug="archived-phase")],
-            milestones=[mock_data.create_milestone(name="Archived Milestone", slug="archived-milestone")],
-            objectives=[mock_data.create_objective(name="Archived Objective", slug="archived-objective")],
-        )
-        
-        # Save
-        manager.save_archived_strategic(archived)
-        
-        # Load
-        result = manager.load_archived_strategic()
-        
-        assert len(result.phases) == 1
-        assert result.phases[0].name == "Archived Phase"
-        assert len(result.milestones) == 1
-        assert len(result.objectives) == 1
-
 
 class TestArchivedExecutionTreeOperations:
     """Test archived execution tree operations."""
 
-    def test_load_archived_execution_empty(self, empty_prism_dir: Path):
+    def test_load_archived_execution_empty(
+        self, read_only_storage_manager: StorageManager
+    ):
         """Load archived execution tree returns None when file doesn't exist."""
-        manager = StorageManager(empty_prism_dir)
-        result = manager.load_archived_execution_tree("test-uuid")
+        result = read_only_storage_manager.load_archived_execution_tree("test-uuid")
         
         assert result is None
 
     def test_save_and_load_archived_execution(
-        self, empty_prism_dir: Path, execution_file: ExecutionFile
+        self, storage_manager: StorageManager, execution_file: ExecutionFile
     ):
         """Save and load archived execution tree preserves data."""
-        manager = StorageManager(empty_prism_dir)
         objective_uuid = "test-objective-uuid"
         
         # Save
-        manager.save_archived_execution_tree(objective_uuid, execution_file)
+        storage_manager.save_archived_execution_tree(objective_uuid, execution_file)
         
         # Load
-        result = manager.load_archived_execution_tree(objective_uuid)
+        result = storage_manager.load_archived_execution_tree(objective_uuid)
         
         assert result is not None
         assert len(result.deliverables) == len(execution_file.deliverables)
         assert len(result.actions) == len(execution_file.actions)
 
-    def test_archived_execution_file_naming(self, empty_prism_dir: Path):
+    def test_load_archived_execution_large(
+        self, storage_manager: StorageManager, mock_data
+    ):
+        """A multi-megabyte archived execution tree round-trips intact."""
+        objective_uuid = "large-objective-uuid"
+        deliverables = [
+            mock_data.create_deliverable(name=f"Deliverable {i}", slug=f"d-{i}")
+            for i in range(100)
+        ]
+        actions = [
+            mock_data.create_action(
+                name=f"Action {i}",
+                description="x" * 200,
+                slug=f"a-{i}",
+                parent_uuid=deliverables[i % 100].uuid,
+            )
+            for i in range(5000)
+        ]
+        execution = ExecutionFile(deliverables=deliverables, actions=actions)
+
+        storage_manager.save_archived_execution_tree(objective_uuid, execution)
+        file_path = storage_manager.archive_dir / f"{objective_uuid}.exec.json"
+        assert os.path.getsize(file_path) >= 1024 * 1024
+
+        result = storage_manager.load_archived_execution_tree(objective_uuid)
+
+        assert result == execution
+
+    def test_archived_execution_file_naming(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
         """Archived execution files use correct naming convention."""
-        manager = StorageManager(empty_prism_dir)
         objective_uuid = "abc-123-xyz"
         execution = ExecutionFile()
         
-        manager.save_archived_execution_tree(objective_uuid, execution)
+        storage_manager.save_archived_execution_tree(objective_uuid, execution)
         
         # Check file exists with correct name
         file_path = empty_prism_dir / "archive" / f"{objective_uuid}.exec.json"
         assert file_path.exists()
 
 
+@pytest.fixture
+def populated_cursor_file() -> CursorFile:
+    """CursorFile with both cursors set."""
+    return CursorFile(
+        task_cursor="phase-1/milestone-1/objective-1/deliverable-1/action-1",
+        crud_context="phase-1/milestone-1/objective-1/deliverable-1",
+    )
+
+
+@pytest.fixture
+def populated_config_file() -> ConfigFile:
+    """ConfigFile with non-default settings."""
+    return ConfigFile(
+        slug_max_length=20,
+        slug_word_limit=5,
+        status_header_width=30,
+    )
+
+
+@pytest.fixture
+def archived_strategic_file(
+    phase_template, milestone_template, objective_template
+) -> ArchivedStrategicFile:
+    """ArchivedStrategicFile with one item of each strategic type."""
+    return ArchivedStrategicFile(
+        phases=[
+            phase_template.model_copy(
+                update={"name": "Archived Phase", "slug": "archived-phase"}
+            )
+        ],
+        milestones=[
+            milestone_template.model_copy(
+                update={"name": "Archived Milestone", "slug": "archived-milestone"}
+            )
+        ],
+        objectives=[
+            objective_template.model_copy(
+                update={"name": "Archived Objective", "slug": "archived-objective"}
+            )
+        ],
+    )
+
+
+class TestFileRoundTrip:
+    """Test that every top-level file survives a save/load round trip."""
+
+    @pytest.mark.parametrize(
+        "file_fixture,saver,loader",
+        [
+            ("strategic_file", "save_strategic", "load_strategic"),
+            ("execution_file", "save_execution", "load_execution"),
+            ("populated_cursor_file", "save_cursor", "load_cursor"),
+            ("populated_config_file", "save_config", "load_config"),
+            (
+                "archived_strategic_file",
+                "save_archived_strategic",
+                "load_archived_strategic",
+            ),
+        ],
+    )
+    def test_save_and_load_preserves_data(
+        self,
+        request,
+        storage_manager: StorageManager,
+        file_fixture: str,
+        saver: str,
+        loader: str,
+    ):
+        """Save and load preserves every persisted field."""
+        data = request.getfixturevalue(file_fixture)
+
+        # Save
+        getattr(storage_manager, saver)(data)
+
+        # Load
+        result = getattr(storage_manager, loader)()
+
+        assert type(result) is type(data)
+        assert result.model_dump() == data.model_dump()
+
+
+class TestBugLogFiles:
+    """Test per-bug log file operations."""
+
+    def test_save_load_delete_buglog(self, storage_manager: StorageManager):
+        """A saved bug log can be read back and then deleted."""
+        buglog = BugLog(title="Stack Trace")
+
+        storage_manager.save_buglog("BUG_01", buglog, "trace")
+
+        assert storage_manager.load_buglog_content("BUG_01", buglog) == "trace"
+        assert storage_manager.delete_buglog("BUG_01", buglog) is True
+
+    def test_load_missing_buglog_raises(self, storage_manager: StorageManager):
+        """Loading a bug log that was never written raises StorageError."""
+        with pytest.raises(StorageError, match="not found"):
+            storage_manager.load_buglog_content("BUG_01", BugLog(title="Missing"))
+
+    def test_delete_missing_buglog_returns_false(
+        self, storage_manager: StorageManager
+    ):
+        """Deleting a bug log that does not exist reports False."""
+        assert storage_manager.delete_buglog("BUG_01", BugLog(title="Missing")) is False
+
+
 class TestAtomicWrites:
     """Test atomic write operations."""
 
-    def test_atomic_write_creates_file(self, empty_prism_dir: Path):
+    def test_atomic_write_creates_file(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
         """Atomic write successfully creates file."""
-        manager = StorageManager(empty_prism_dir)
         data = {"test": "data"}
         file_path = empty_prism_dir / "test.json"
         
-        manager._atomic_write(file_path, data)
+        storage_manager._atomic_write_bytes(file_path, encode(data))
         
         assert file_path.exists()
         with open(file_path, "r") as f:
             loaded = json.load(f)
         assert loaded == data
 
-    def test_atomic_write_overwrites(self, empty_prism_dir: Path):
+    def test_atomic_write_overwrites(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
         """Atomic write overwrites existing file."""
-        manager = StorageManager(empty_prism_dir)
         file_path = empty_prism_dir / "test.json"
         
         # Write initial data
-        manager._atomic_write(file_path, {"initial": "data"})
+        storage_manager._atomic_write_bytes(file_path, encode({"initial": "data"}))
         
         # Overwrite
-        manager._atomic_write(file_path, {"updated": "data"})
+        storage_manager._atomic_write_bytes(file_path, encode({"updated": "data"}))
         
         with open(file_path, "r") as f:
             loaded = json.load(f)
         assert loaded == {"updated": "data"}
 
-    def test_atomic_write_no_temp_files_left(self, empty_prism_dir: Path):
+    def test_atomic_write_no_temp_files_left(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
         """Atomic write doesn't leave temp files on success."""
-        manager = StorageManager(empty_prism_dir)
         data = {"test": "data"}
         file_path = empty_prism_dir / "test.json"
         
-        manager._atomic_write(file_path, data)
+        storage_manager._atomic_write_bytes(file_path, encode(data))
         
         # Check no temp files remain
         temp_files = list(empty_prism_dir.glob(".tmp_prism_*.json"))
         assert len(temp_files) == 0
 
 
+class TestMissingFileCache:
+    """Test remembering files known to be absent."""
+
+    def test_repeated_miss_skips_filesystem(self, storage_manager: StorageManager):
+        """A second load of an absent file does not probe the filesystem."""
+        storage_manager.load_cursor()
+
+        with patch("builtins.open") as open_:
+            result = storage_manager.load_cursor()
+
+        assert open_.call_count == 0
+        assert result.task_cursor is None
+
+    def test_save_clears_missing_entry(self, storage_manager: StorageManager):
+        """Saving a file makes later loads read it again."""
+        assert storage_manager.load_cursor().task_cursor is None
+
+        storage_manager.save_cursor(CursorFile(task_cursor="a/b"))
+
+        assert storage_manager.load_cursor().task_cursor == "a/b"
+
+    def test_transaction_clears_missing_entry(self, storage_manager: StorageManager):
+        """Files written in a transaction are visible to later loads."""
+        storage_manager.load_cursor()
+
+        with storage_manager.transaction():
+            storage_manager.save_cursor(CursorFile(task_cursor="a/b"))
+
+        assert storage_manager.load_cursor().task_cursor == "a/b"
+
+
+class TestTransaction:
+    """Test grouped writes via transaction()."""
+
+    def test_transaction_defers_writes_until_exit(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
+        """Files appear only when the transaction block exits."""
+        first = empty_prism_dir / "first.json"
+        second = empty_prism_dir / "second.json"
+
+        with storage_manager.transaction():
+            storage_manager._atomic_write_bytes(first, encode({"n": 1}))
+            storage_manager._atomic_write_bytes(second, encode({"n": 2}))
+            assert not first.exists()
+            assert not second.exists()
+
+        assert json.loads(first.read_text()) == {"n": 1}
+        assert json.loads(second.read_text()) == {"n": 2}
+        assert list(empty_prism_dir.glob(".tmp_prism_*.json")) == []
+
+    def test_transaction_discards_writes_on_error(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
+        """An exception inside the block leaves existing files untouched."""
+        file_path = empty_prism_dir / "test.json"
+        storage_manager._atomic_write_bytes(file_path, encode({"initial": "data"}))
+
+        with pytest.raises(RuntimeError):
+            with storage_manager.transaction():
+                storage_manager._atomic_write_bytes(
+                    file_path, encode({"updated": "data"})
+                )
+                raise RuntimeError("boom")
+
+        assert json.loads(file_path.read_text()) == {"initial": "data"}
+        assert list(empty_prism_dir.glob(".tmp_prism_*.json")) == []
+
+    def test_multiple_saves_same_file(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
+        """Repeated saves of one file in a transaction rename only the last."""
+        with patch("os.replace", wraps=os.replace) as replace:
+            with storage_manager.transaction():
+                for width in (30, 40, 50):
+                    storage_manager.save_config(
+                        ConfigFile(status_header_width=width)
+                    )
+                assert len(list(empty_prism_dir.glob(".tmp_prism_*.json"))) == 1
+
+        assert replace.call_count == 1
+        assert storage_manager.load_config().status_header_width == 50
+        assert list(empty_prism_dir.glob(".tmp_prism_*.json")) == []
+
+
+class TestDurableWrites:
+    """Test fsync behavior of durable and default managers."""
+
+    def test_default_manager_does_not_fsync(self, storage_manager: StorageManager):
+        """Writes skip fsync unless durability is requested."""
+        with patch("os.fsync") as fsync, patch(
+            "os.fdatasync", create=True
+        ) as fdatasync:
+            storage_manager.save_cursor(CursorFile(task_cursor="a"))
+
+        assert fsync.call_count == 0
+        assert fdatasync.call_count == 0
+
+    def test_transaction_syncs_directory_once(self, empty_prism_dir: Path):
+        """A durable batch syncs every file but the directory only once."""
+        manager = StorageManager(empty_prism_dir, durable=True)
+
+        with patch("os.fsync", wraps=os.fsync) as fsync, patch(
+            "os.fdatasync", create=True
+        ) as fdatasync:
+            with manager.transaction():
+                for i in range(10):
+                    manager._atomic_write_bytes(
+                        empty_prism_dir / f"f{i}.json", encode({"i": i})
+                    )
+
+        # File contents go through fdatasync; only the directory needs fsync
+        assert fdatasync.call_count == 10
+        assert fsync.call_count == 1
+        assert len(list(empty_prism_dir.glob("f*.json"))) == 10
+
+    def test_save_all_load_all(
+        self,
+        empty_prism_dir: Path,
+        strategic_file: StrategicFile,
+        execution_file: ExecutionFile,
+        config_file: ConfigFile,
+    ):
+        """Saving every top-level file in one transaction pays one directory sync."""
+        manager = StorageManager(empty_prism_dir, durable=True)
+        orphans = OrphansFile()
+
+        with patch("os.fsync", wraps=os.fsync) as fsync, patch(
+            "os.fdatasync", create=True
+        ) as fdatasync:
+            with manager.transaction():
+                manager.save_strategic(strategic_file)
+                manager.save_execution(execution_file)
+                manager.save_config(config_file)
+                manager.save_orphans(orphans)
+
+        # One data sync per file, then one fsync for .prism/ itself
+        assert fdatasync.call_count == 4
+        assert fsync.call_count == 1
+        assert manager.load_strategic().model_dump() == strategic_file.model_dump()
+        assert manager.load_execution().model_dump() == execution_file.model_dump()
+        assert manager.load_config() == config_file
+        assert manager.load_orphans() == orphans
+
+
 class TestStorageErrors:
     """Test error handling in StorageManager."""
 
-    def test_invalid_json_raises_storage_error(self, empty_prism_dir: Path):
+    def test_invalid_json_raises_storage_error(
+        self, storage_manager: StorageManager, empty_prism_dir: Path
+    ):
         """Loading invalid JSON raises StorageError."""
-        manager = StorageManager(empty_prism_dir)
         
         # Write invalid JSON
         file_path = empty_prism_dir / "strategic.json"
@@ -331,7 +549,7 @@ class TestStorageErrors:
             f.write("not valid json {{{")
         
         with pytest.raises(StorageError):
-            manager.load_strategic()
+            storage_manager.load_strategic()
 
     def test_write_to_invalid_path_raises(self, temp_dir: Path):
         """Writing to invalid path raises StorageError."""
@@ -340,4 +558,4 @@ class TestStorageErrors:
         manager = StorageManager(temp_dir / ".prism")
         
         with pytest.raises(StorageError):
-            manager._atomic_write(invalid_path, {"test": "data"})
+            manager._atomic_write_bytes(invalid_path, encode({"test": "data"}))
@@ -9,50 +9,51 @@ Tests cover:
 - Slug generation
 """
 
-from datetime import datetime
-
 import pytest
 
 from prism.exceptions import InvalidOperationError, NotFoundError, ValidationError
+from prism.managers.archive_manager import ArchiveManager
+from prism.managers.crud_manager import CRUDManager
 from prism.managers.navigation_manager import NavigationManager
 from prism.managers.task_manager import TaskManager
+from prism.models.base import Action, Deliverable, Objective
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
+class SaveCounter:
+    """Save callback that counts how often it is called."""
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self) -> None:
+        self.count += 1
+
+
 @pytest.fixture
 def task_manager(sample_project):
     """Create TaskManager with sample project."""
     navigator = NavigationManager(sample_project)
-    save_count = {"count": 0}
+    save_counter = SaveCounter()
 
-    def save_callback():
-        save_count["count"] += 1
-
-    manager = TaskManager(sample_project, navigator, save_callback)
-    manager._save_count = save_count
+    manager = TaskManager(sample_project, navigator, save_counter)
+    manager._save_counter = save_counter
     return manager
 
 
 @pytest.fixture
-def crud_manager(sample_project, empty_prism_dir):
+def crud_manager(sample_project, storage_manager):
     """Create CRUDManager with sample project."""
-    from prism.managers.archive_manager import ArchiveManager
-    from prism.managers.crud_manager import CRUDManager
-    from prism.managers.storage_manager import StorageManager
-
-    storage = StorageManager(empty_prism_dir)
-    archive_mgr = ArchiveManager(storage)
+    archive_mgr = ArchiveManager(storage_manager)
 
     navigator = NavigationManager(sample_project)
-    save_count = {"count": 0}
-
-    def save_callback():
-        save_count["count"] += 1
 
-    task_mgr = TaskManager(sample_project, navigator, save_callback)
+    task_mgr = TaskManager(sample_project, navigator, SaveCounter())
     manager = CRUDManager(sample_project, navigator, archive_mgr, task_mgr)
     return manager
 
@@ -166,11 +167,11 @@ class TestCompleteCurrentAction:
     def test_complete_current_action_triggers_save(self, task_manager):
         """Complete current action triggers save callback."""
         task_manager.start_next_action()
-        before = task_manager._save_count["count"]
+        before = task_manager._save_counter.count
 
         task_manager.complete_current_action()
 
-        assert task_manager._save_count["count"] > before
+        assert task_manager._save_counter.count > before
 
 
 class TestCompleteCurrentAndStartNext:
@@ -186,6 +187,18 @@ class TestCompleteCurrentAndStartNext:
         assert completed.status == "completed"
         # Next action might be None if all complete or might be another action
 
+    def test_complete_and_start_next_saves_once(self, task_manager):
+        """Completing and starting the next action persists a single time."""
+        task_manager.start_next_action()
+        before = task_manager._save_counter.count
+
+        completed, next_action = task_manager.complete_current_and_start_next()
+
+        assert completed is not None
+        assert next_action is not None
+        assert next_action.status == "in-progress"
+        assert task_manager._save_counter.count == before + 1
+
     def test_complete_and_start_next_none_when_not_started(self, task_manager):
         """Complete and start next returns (None, None) when not started."""
         completed, next_action = task_manager.complete_current_and_start_next()
@@ -202,32 +215,42 @@ class TestCompleteCurrentAndStartNext:
 class TestCascadeCompletion:
     """Test completion cascading up the tree."""
 
-    def test_cascade_completes_deliverable_when_all_actions_done(
-        self, task_manager, mock_data
-    ):
+    def test_cascade_completes_deliverable_when_all_actions_done(self, task_manager):
         """Cascade marks deliverable complete when all actions complete."""
-        # Start and complete all actions in deliverable-1
-        task_manager.project.task_cursor = (
-            "phase-1/milestone-1/objective-1/deliverable-1/action-1"
-        )
-        task_manager.start_next_action()
-        task_manager.complete_current_action()
-
-        task_manager.project.task_cursor = (
-            "phase-1/milestone-1/objective-1/deliverable-1/action-2"
-        )
-        task_manager.start_next_action()
-        task_manager.complete_current_action()
-
-        # Deliverable should be complete
         phase = task_manager.project.phases[0]
         milestone = phase.children[0]
         objective = milestone.children[0]
         deliverable = objective.children[0]
 
+        # Complete every action in deliverable-1, then cascade from the last
+        for action in deliverable.children:
+            action.status = "completed"
+        task_manager._cascade_completion(action)
+
         assert deliverable.status == "completed"
 
-    def test_cascade_completes_objective_when_all_deliverables_done(self, task_manager):
+    def test_cascade_stamps_parents_with_action_completion_time(self, task_manager):
+        """Parents completed by a cascade share the action's updated_at."""
+        objective = task_manager.project.phases[0].children[0].children[0]
+        first, second = objective.children
+        for action in first.children:
+            action.status = "completed"
+        first.status = "completed"
+        second.children[0].status = "in-progress"
+        task_manager.project.task_cursor = (
+            "phase-1/milestone-1/objective-1/deliverable-2/action-3"
+        )
+
+        action = task_manager.complete_current_action()
+
+        assert second.status == "completed"
+        assert objective.status == "completed"
+        assert second.updated_at == action.updated_at
+        assert objective.updated_at == action.updated_at
+
+    def test_cascade_completes_objective_when_all_deliverables_done(
+        self, task_manager, helpers
+    ):
         """Cascade marks objective complete when all deliverables complete."""
         # Complete all actions in all deliverables
         phase = task_manager.project.phases[0]
@@ -235,28 +258,21 @@ class TestCascadeCompletion:
         objective = milestone.children[0]
 
         for deliverable in objective.children:
-            for action in deliverable.children:
-                action.status = "completed"
-                action.updated_at = datetime.now()
-            deliverable.status = "completed"
+            helpers["mark_completed"](deliverable)
 
         # Manually trigger cascade on last deliverable
         task_manager._cascade_completion(deliverable)
 
         assert objective.status == "completed"
 
-    def test_cascade_stops_at_objective(self, task_manager):
+    def test_cascade_stops_at_objective(self, task_manager, helpers):
         """Cascade does not propagate to milestone or phase."""
         # Complete everything
         phase = task_manager.project.phases[0]
         milestone = phase.children[0]
         objective = milestone.children[0]
 
-        for deliverable in objective.children:
-            for action in deliverable.children:
-                action.status = "completed"
-            deliverable.status = "completed"
-        objective.status = "completed"
+        helpers["mark_completed"](objective)
 
         # Trigger cascade
         task_manager._cascade_completion(objective)
@@ -274,7 +290,6 @@ class TestCascadeCompletion:
         milestone.status = "completed"
         
         # Create a new objective and add it to the milestone
-        from prism.models.base import Objective
         new_objective = Objective(
             name="New Objective",
             description="Test",
@@ -300,7 +315,6 @@ class TestCascadeCompletion:
         phase.status = "completed"
 
         # Create a new objective and add it to the milestone
-        from prism.models.base import Objective
         new_objective = Objective(
             name="New Objective",
             description="Test",
@@ -326,7 +340,6 @@ class TestCascadeCompletion:
         deliverable.status = "completed"
 
         # Create a new action and add it to the deliverable
-        from prism.models.base import Action
         new_action = Action(
             name="New Action",
             description="Test",
@@ -350,7 +363,6 @@ class TestCascadeCompletion:
         objective.status = "completed"
 
         # Create a new deliverable and add it to the objective
-        from prism.models.base import Deliverable
         new_deliverable = Deliverable(
             name="New Deliverable",
             description="Test",
@@ -373,33 +385,23 @@ class TestCascadeCompletion:
 class TestCalculateCompletionPercentage:
     """Test completion percentage calculations."""
 
-    def test_percentage_deliverable_partial(self, task_manager):
-        """Calculate percentage for partially complete deliverable."""
+    @pytest.mark.parametrize(
+        "completed_actions,expected",
+        [(0, 0.0), (1, 50.0), (2, 100.0)],
+    )
+    def test_percentage_deliverable(self, task_manager, completed_actions, expected):
+        """Calculate percentage for a deliverable with 0, 1 or 2 of 2 actions done."""
         phase = task_manager.project.phases[0]
         milestone = phase.children[0]
         objective = milestone.children[0]
         deliverable = objective.children[0]
 
-        # 1 of 2 actions complete
-        deliverable.children[0].status = "completed"
-
-        result = task_manager.calculate_completion_percentage(deliverable)
-
-        assert result["overall"] == 50.0
-
-    def test_percentage_deliverable_complete(self, task_manager):
-        """Calculate percentage for complete deliverable."""
-        phase = task_manager.project.phases[0]
-        milestone = phase.children[0]
-        objective = milestone.children[0]
-        deliverable = objective.children[0]
-
-        for action in deliverable.children:
+        for action in deliverable.children[:completed_actions]:
             action.status = "completed"
 
         result = task_manager.calculate_completion_percentage(deliverable)
 
-        assert result["overall"] == 100.0
+        assert result["overall"] == expected
 
     def test_percentage_objective_partial(self, task_manager):
         """Calculate percentage for partially complete objective."""
@@ -429,16 +431,14 @@ class TestCalculateCompletionPercentage:
 class TestIsExecTreeComplete:
     """Test execution tree completion check."""
 
-    def test_exec_tree_complete(self, task_manager):
+    def test_exec_tree_complete(self, task_manager, helpers):
         """Is exec tree complete returns True when all done."""
         phase = task_manager.project.phases[0]
         milestone = phase.children[0]
         objective = milestone.children[0]
 
         for deliverable in objective.children:
-            for action in deliverable.children:
-                action.status = "completed"
-            deliverable.status = "completed"
+            helpers["mark_completed"](deliverable)
 
         result = task_manager.is_exec_tree_complete(objective)
 
@@ -463,13 +463,14 @@ class TestIsExecTreeComplete:
 class TestAddItem:
     """Test add_item method."""
 
-    def test_add_phase(self, crud_manager, mock_data):
-        """Add phase to project."""
+    @pytest.mark.parametrize("parent_path", [None, ""], ids=["none", "empty"])
+    def test_add_phase(self, crud_manager, parent_path):
+        """Add phase to project; an empty parent path means no parent."""
         result = crud_manager.add_item(
             item_type="phase",
             name="New Phase",
             description="Test phase",
-            parent_path=None,
+            parent_path=parent_path,
         )
 
         assert result is not None
@@ -502,36 +503,38 @@ class TestAddItem:
         assert result is not None
         assert result.name == "New Action"
 
-    def test_add_item_invalid_parent_type(self, crud_manager):
-        """Add item raises error for invalid parent type."""
-        with pytest.raises(InvalidOperationError):
-            crud_manager.add_item(
-                item_type="action",
-                name="Bad Action",
-                description="Test",
-                parent_path="phase-1",  # Actions need deliverable parent
-            )
+    @pytest.mark.parametrize(
+        "item_type,parent_path,error",
+        [
+            # Actions need a deliverable parent
+            ("action", "phase-1", InvalidOperationError),
+            ("milestone", "nonexistent-path", NotFoundError),
+        ],
+        ids=["invalid-parent-type", "parent-not-found"],
+    )
+    def test_add_item_rejected(self, crud_manager, item_type, parent_path, error):
+        """Add item raises for a bad or missing parent and adds nothing."""
+        phase = crud_manager.project.phases[0]
 
-    def test_add_item_parent_not_found(self, crud_manager):
-        """Add item raises error when parent not found."""
-        with pytest.raises(NotFoundError):
+        with pytest.raises(error):
             crud_manager.add_item(
-                item_type="milestone",
-                name="Bad Milestone",
+                item_type=item_type,
+                name="Bad Item",
                 description="Test",
-                parent_path="nonexistent-path",
+                parent_path=parent_path,
             )
 
+        assert len(crud_manager.project.phases) == 1
+        assert len(phase.children) == 1
+
 
 class TestAutoArchiveOnAdd:
     """Test auto-archive behavior when adding new strategic items."""
 
     def test_archive_current_completed_objective_when_adding_new_objective(
-        self, crud_manager, mock_data, empty_prism_dir
+        self, crud_manager, mock_data, storage_manager
     ):
         """Adding new objective archives current completed objective in same milestone."""
-        from prism.managers.storage_manager import StorageManager
-
         # Setup: add completed objective to existing milestone
         objective1 = mock_data.create_objective(
             name="Objective 1",
@@ -556,8 +559,7 @@ class TestAutoArchiveOnAdd:
         assert result.name == "Objective 2"
 
         # Verify old objective is in archive file
-        storage = StorageManager(empty_prism_dir)
-        archived_file = storage.load_archived_strategic()
+        archived_file = storage_manager.load_archived_strategic()
         archived_uuids = [o.uuid for o in archived_file.objectives]
         assert "objective-1-uuid" in archived_uuids
 
@@ -588,11 +590,9 @@ class TestAutoArchiveOnAdd:
         assert objective1 in milestone.children
 
     def test_archive_cascades_to_execution_tree(
-        self, crud_manager, mock_data, empty_prism_dir
+        self, crud_manager, mock_data, storage_manager
     ):
         """Archiving objective also archives its execution tree."""
-        from prism.managers.storage_manager import StorageManager
-
         # Setup: completed objective with execution tree
         objective1 = mock_data.create_objective(
             name="Objective 1",
@@ -632,18 +632,15 @@ class TestAutoArchiveOnAdd:
         )
 
         # Verify execution tree archived
-        storage = StorageManager(empty_prism_dir)
-        exec_tree = storage.load_archived_execution_tree("objective-1-uuid")
+        exec_tree = storage_manager.load_archived_execution_tree("objective-1-uuid")
         assert exec_tree is not None
         assert len(exec_tree.deliverables) == 1
         assert len(exec_tree.actions) == 1
 
     def test_archive_current_completed_milestone_when_adding_new_milestone(
-        self, crud_manager, mock_data, empty_prism_dir
+        self, crud_manager, mock_data, storage_manager
     ):
         """Adding new milestone archives current completed milestone in same phase."""
-        from prism.managers.storage_manager import StorageManager
-
         # Setup: add completed milestone to existing phase
         milestone1 = mock_data.create_milestone(
             name="Milestone 1",
@@ -668,8 +665,7 @@ class TestAutoArchiveOnAdd:
         assert result.name == "Milestone 2"
 
         # Verify old milestone is in archive file
-        storage = StorageManager(empty_prism_dir)
-        archived_file = storage.load_archived_strategic()
+        archived_file = storage_manager.load_archived_strategic()
         archived_uuids = [m.uuid for m in archived_file.milestones]
         assert "milestone-1-uuid-new" in archived_uuids
 
@@ -701,11 +697,9 @@ class TestAutoArchiveOnAdd:
         assert objective1 in milestone.children
 
     def test_does_not_archive_incomplete_objective_with_pending_deliverables(
-        self, crud_manager, mock_data, empty_prism_dir
+        self, crud_manager, mock_data, storage_manager
     ):
         """Adding new objective does not archive sibling with pending deliverables."""
-        from prism.managers.storage_manager import StorageManager
-
         # Setup: objective with completed status but pending deliverables
         objective1 = mock_data.create_objective(
             name="Objective 1",
@@ -739,8 +733,7 @@ class TestAutoArchiveOnAdd:
         assert objective1 in milestone.children
 
         # Verify not in archive
-        storage = StorageManager(empty_prism_dir)
-        archived_file = storage.load_archived_strategic()
+        archived_file = storage_manager.load_archived_strategic()
         archived_uuids = [o.uuid for o in archived_file.objectives]
         assert "objective-1-uuid" not in archived_uuids
 
@@ -883,6 +876,16 @@ class TestUpdateItem:
         with pytest.raises(ValidationError):
             crud_manager.update_item(path="phase-1")
 
+    def test_update_invalid_status_leaves_item_unchanged(self, crud_manager):
+        """A rejected update does not half-apply its other fields."""
+        phase = crud_manager.project.phases[0]
+
+        with pytest.raises(ValidationError):
+            crud_manager.update_item(path="phase-1", name="Renamed", status="bogus")
+
+        assert phase.name == "Phase 1"
+        assert phase.slug == "phase-1"
+
 
 # =============================================================================
 # CRUD - Delete Item Tests
@@ -894,16 +897,14 @@ class TestDeleteItem:
 
     def test_delete_action(self, crud_manager):
         """Delete action from deliverable."""
+        deliverable = crud_manager.project.get_item("deliverable-1-uuid")
+
         crud_manager.delete_item(
             path="phase-1/milestone-1/objective-1/deliverable-1/action-1"
         )
 
-        phase = crud_manager.project.phases[0]
-        milestone = phase.children[0]
-        objective = milestone.children[0]
-        deliverable = objective.children[0]
-
-        assert len(deliverable.children) == 1
+        assert [action.slug for action in deliverable.children] == ["action-2"]
+        assert deliverable.child_uuids == ["action-2-uuid"]
 
     def test_delete_phase(self, crud_manager):
         """Delete phase from project."""
@@ -0,0 +1,133 @@
+"""
+Tests for prism.utils helpers.
+
+Tests cover:
+- parse_date across every supported format, plus rejected inputs
+- validate_date_range bounds
+- format_date output
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from prism.constants import DATE_MAX_YEARS_FUTURE, DATE_MAX_YEARS_PAST
+from prism.utils import format_date, parse_date, validate_date_range
+
+# The date every supported-format case spells out
+DEC_31_2024 = datetime(2024, 12, 31)
+
+
+class TestParseDate:
+    """Test date string parsing."""
+
+    @pytest.mark.parametrize(
+        "date_string,expected",
+        [
+            ("2024-12-31", DEC_31_2024),
+            ("2024-1-5", datetime(2024, 1, 5)),
+            ("2024/12/31", DEC_31_2024),
+            ("2024/1/5", datetime(2024, 1, 5)),
+            ("31-12-2024", DEC_31_2024),
+            ("31/12/2024", DEC_31_2024),
+            ("12-31-2024", DEC_31_2024),
+            ("12/31/2024", DEC_31_2024),
+            ("20241231", DEC_31_2024),
+            ("31 December 2024", DEC_31_2024),
+            ("31 Dec 2024", DEC_31_2024),
+            ("December 31, 2024", DEC_31_2024),
+            ("Dec 31, 2024", DEC_31_2024),
+        ],
+    )
+    def test_parse_supported_format(self, date_string, expected):
+        """Every supported format parses to midnight on that day."""
+        assert parse_date(date_string) == expected
+
+    @pytest.mark.parametrize(
+        "date_string",
+        [
+            "",
+            "invalid-date",
+            "2024-12",
+            "2024-12-31 extra",
+            "2024-02-30",
+            "2024/02/30",
+            "2024-12/31",
+            "2024-W01-1",
+            "2024-12-31T10:00",
+            "31-12-20241",
+            "Dec 31 2024",
+            "31 Smarch 2024",
+        ],
+    )
+    def test_parse_rejected_input_returns_none(self, date_string):
+        """Unparseable or out-of-format strings return None."""
+        assert parse_date(date_string) is None
+
+
+@pytest.fixture(scope="module")
+def now():
+    """Fixed reference time, so date-range bounds don't drift with the clock."""
+    return datetime(2030, 6, 15)
+
+
+class TestValidateDateRange:
+    """Test the accepted due-date window."""
+
+    def test_date_measured_from_given_now(self, now):
+        """Bounds are measured from the supplied reference time."""
+        assert validate_date_range(datetime(2035, 1, 1), now=now) == (True, None)
+
+        is_valid, error_msg = validate_date_range(datetime(2026, 1, 1), now=now)
+        assert not is_valid
+        assert "too far in the past" in error_msg
+
+    def test_date_at_limits_is_valid(self, now):
+        """Dates exactly on either bound are accepted."""
+        min_date = now.replace(year=now.year - DATE_MAX_YEARS_PAST)
+        max_date = now.replace(year=now.year + DATE_MAX_YEARS_FUTURE)
+
+        assert validate_date_range(min_date, now=now) == (True, None)
+        assert validate_date_range(max_date, now=now) == (True, None)
+
+    def test_date_past_limits_is_invalid(self, now):
+        """Dates a day beyond either bound are rejected."""
+        min_date = now.replace(year=now.year - DATE_MAX_YEARS_PAST)
+        max_date = now.replace(year=now.year + DATE_MAX_YEARS_FUTURE)
+
+        is_valid, error_msg = validate_date_range(min_date - timedelta(days=1), now=now)
+        assert not is_valid
+        assert "too far in the past" in error_msg
+
+        is_valid, error_msg = validate_date_range(max_date + timedelta(days=1), now=now)
+        assert not is_valid
+        assert "too far in the future" in error_msg
+
+    def test_leap_day_reference_clamps_to_feb_28(self):
+        """On Feb 29 the bounds fall on Feb 28 of non-leap years."""
+        leap_day = datetime(2024, 2, 29)
+
+        assert validate_date_range(datetime(2023, 2, 28), now=leap_day) == (True, None)
+        is_valid, error_msg = validate_date_range(datetime(2023, 2, 27), now=leap_day)
+        assert not is_valid
+        assert "too far in the past" in error_msg
+
+    def test_date_defaults_to_current_time(self):
+        """Without a reference time, today is in range."""
+        assert validate_date_range(datetime.now()) == (True, None)
+
+
+class TestFormatDate:
+    """Test date formatting."""
+
+    @pytest.mark.parametrize(
+        "date,expected",
+        [
+            (DEC_31_2024, "2024-12-31"),
+            (datetime(2024, 1, 5, 23, 59), "2024-01-05"),
+            (datetime(999, 1, 1), "0999-01-01"),
+        ],
+    )
+    def test_format_date(self, date, expected):
+        """Dates format as zero-padded YYYY-MM-DD, dropping the time."""
+        assert format_date(date) == expected